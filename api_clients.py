@@ -1,22 +1,153 @@
+import atexit
+import functools
+import hashlib
+import re
 import requests
 import json
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Dict, List, Optional, Any
 from urllib.parse import quote_plus, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 from config import Config
 
+# Keyword extraction setup (done once per process instead of on every call)
+try:
+    import nltk
+    from nltk.corpus import stopwords
+    
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+    
+    _STOPWORDS = frozenset(stopwords.words('english'))
+except Exception as e:  # ImportError, or the corpus could not be downloaded
+    print(f"NLTK stopwords unavailable, keyword extraction disabled: {str(e)}")
+    _STOPWORDS = None
+
+# Lowercase alphabetic tokens of 3+ characters (same filter the old word_tokenize loop applied)
+_WORD_RE = re.compile(r"[a-z]{3,}")
+
+@functools.lru_cache(maxsize=8192)
+def parse_url(url: str):
+    """Memoised urlparse - the same URLs are parsed repeatedly across validation and scoring"""
+    return urlparse(url)
+
+@functools.lru_cache(maxsize=4096)
+def _classify_domain(domain: str) -> str:
+    """Classify a lowercased domain as 'reliable', 'unreliable' or 'unknown' using the Config source lists"""
+    if Config.is_reliable(domain):
+        return 'reliable'
+    if Config.is_unreliable(domain):
+        return 'unreliable'
+    return 'unknown'
+
+# Shared worker pool for independent outbound API calls (I/O bound, so threads overlap well)
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# In-process TTL caches for read-only lookups that are re-queried often (e.g. live monitoring)
+_news_cache = TTLCache(maxsize=512, ttl=Config.API_CACHE_TTL)
+_news_lock = Lock()
+_search_cache = TTLCache(maxsize=512, ttl=Config.API_CACHE_TTL)
+_search_lock = Lock()
+_fact_check_cache = TTLCache(maxsize=512, ttl=Config.API_CACHE_TTL)
+_fact_check_lock = Lock()
+
+@functools.lru_cache(maxsize=None)
+def _lookup_cache():
+    """On-disk cache shared by every process (optional - None if diskcache is unavailable)"""
+    try:
+        import diskcache
+        cache = diskcache.Cache(Config.LOOKUP_CACHE_DIR)
+        atexit.register(cache.close)
+        return cache
+    except Exception:
+        return None
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers until a request slot is available"""
+    
+    def __init__(self, rate_per_sec: float, capacity: int):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = Lock()
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, sleeping until the bucket has refilled enough if it is empty.
+        Returns False instead of waiting past `timeout` seconds (None waits indefinitely)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+# One bucket per provider, shared by every client instance (user requests and live monitoring)
+_news_bucket = TokenBucket(*Config.NEWS_API_RATE)
+_search_bucket = TokenBucket(*Config.GOOGLE_CSE_RATE)
+_fact_check_bucket = TokenBucket(*Config.FACT_CHECK_RATE)
+
+class _CappedRetry(Retry):
+    """Retry policy that honours Retry-After but never sleeps longer than Config.MAX_RETRY_AFTER"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, Config.MAX_RETRY_AFTER)
+
+def _build_session() -> requests.Session:
+    """Create a pooled HTTP session so repeat calls to the same host reuse connections"""
+    session = requests.Session()
+    # Back off exponentially on rate limiting and transient upstream errors, honouring a capped
+    # Retry-After so the retries fit inside a caller's lookup timeout
+    retry = _CappedRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    atexit.register(session.close)
+    return session
+
 class NewsAPIClient:
     """Client for NewsAPI.org - provides news articles and sources"""
     
     def __init__(self):
         self.api_key = Config.NEWS_API_KEY
         self.base_url = Config.NEWS_API_URL
+        self.session = _build_session()
     
     def search_articles(self, query: str, language: str = 'en', page_size: int = 10) -> Dict[str, Any]:
         """Search for news articles related to a query"""
         if not self.api_key:
             return {"status": "error", "message": "NewsAPI key not configured"}
         
+        key = (query.lower().strip(), language, page_size)
+        with _news_lock:
+            cached = _news_cache.get(key)
+        if cached is not None:
+            return cached
+        
         url = f"{self.base_url}/everything"
         params = {
             'q': query,
@@ -26,11 +157,19 @@ class NewsAPIClient:
             'apiKey': self.api_key
         }
         
+        if not _news_bucket.acquire(Config.RATE_LIMIT_WAIT):
+            return {"status": "error", "message": "NewsAPI rate limit wait exceeded"}
         try:
-            response = requests.get(url, params=params, timeout=10)
-            return response.json()
+            response = self.session.get(url, params=params, timeout=10)
+            data = response.json()
         except Exception as e:
             return {"status": "error", "message": f"NewsAPI request failed: {str(e)}"}
+        
+        # Only cache successful responses so transient failures are retried
+        if data.get("status") == "ok":
+            with _news_lock:
+                _news_cache[key] = data
+        return data
     
     def get_sources(self, category: Optional[str] = None) -> Dict[str, Any]:
         """Get available news sources"""
@@ -42,8 +181,10 @@ class NewsAPIClient:
         if category:
             params['category'] = category
         
+        if not _news_bucket.acquire(Config.RATE_LIMIT_WAIT):
+            return {"status": "error", "message": "NewsAPI rate limit wait exceeded"}
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             return response.json()
         except Exception as e:
             return {"status": "error", "message": f"NewsAPI sources request failed: {str(e)}"}
@@ -54,23 +195,49 @@ class GoogleFactCheckClient:
     def __init__(self):
         self.api_key = Config.GOOGLE_CSE_API_KEY
         self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+        self.session = _build_session()
     
     def search_fact_checks(self, query: str, language_code: str = 'en') -> Dict[str, Any]:
         """Search for fact checks related to a claim"""
         if not self.api_key:
             return {"status": "error", "message": "Google API key not configured"}
         
+        key = (query.lower().strip(), language_code)
+        with _fact_check_lock:
+            cached = _fact_check_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Trending claims are checked by many workers; fall back to the shared disk cache
+        disk = _lookup_cache()
+        disk_key = 'fc:' + hashlib.sha1(f"{key[0]}|{language_code}".encode('utf-8')).hexdigest()
+        if disk is not None:
+            cached = disk.get(disk_key)
+            if cached is not None:
+                with _fact_check_lock:
+                    _fact_check_cache[key] = cached
+                return cached
+        
         params = {
             'query': query,
             'languageCode': language_code,
             'key': self.api_key
         }
         
+        if not _fact_check_bucket.acquire(Config.RATE_LIMIT_WAIT):
+            return {"status": "error", "message": "Fact check rate limit wait exceeded"}
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            return response.json()
+            response = self.session.get(self.base_url, params=params, timeout=10)
+            data = response.json()
         except Exception as e:
             return {"status": "error", "message": f"Fact check request failed: {str(e)}"}
+        
+        if response.ok and "error" not in data:
+            with _fact_check_lock:
+                _fact_check_cache[key] = data
+            if disk is not None:
+                disk.set(disk_key, data, expire=Config.LOOKUP_CACHE_TTL)
+        return data
 
 class GoogleCustomSearchClient:
     """Client for Google Custom Search API"""
@@ -79,12 +246,19 @@ class GoogleCustomSearchClient:
         self.api_key = Config.GOOGLE_CSE_API_KEY
         self.cse_id = Config.GOOGLE_CSE_ID
         self.base_url = Config.GOOGLE_CSE_URL
+        self.session = _build_session()
     
     def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Search for information using Google Custom Search"""
         if not self.api_key or not self.cse_id:
             return {"status": "error", "message": "Google Custom Search not configured"}
         
+        key = (query.lower().strip(), num_results)
+        with _search_lock:
+            cached = _search_cache.get(key)
+        if cached is not None:
+            return cached
+        
         params = {
             'key': self.api_key,
             'cx': self.cse_id,
@@ -92,11 +266,18 @@ class GoogleCustomSearchClient:
             'num': min(num_results, 10)  # Max 10 per request for free tier
         }
         
+        if not _search_bucket.acquire(Config.RATE_LIMIT_WAIT):
+            return {"status": "error", "message": "Google search rate limit wait exceeded"}
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            return response.json()
+            response = self.session.get(self.base_url, params=params, timeout=10)
+            data = response.json()
         except Exception as e:
             return {"status": "error", "message": f"Google search request failed: {str(e)}"}
+        
+        if response.ok and "error" not in data:
+            with _search_lock:
+                _search_cache[key] = data
+        return data
 
 class FreeTextAnalysisClient:
     """Client for free text analysis using local processing and free APIs"""
@@ -130,35 +311,16 @@ class FreeTextAnalysisClient:
     
     @staticmethod
     def extract_keywords(text: str, num_keywords: int = 10) -> List[str]:
-        """Extract keywords using NLTK (free local processing)"""
+        """Extract keywords using NLTK stopwords (free local processing)"""
+        if _STOPWORDS is None:
+            return []
+        
         try:
-            import nltk
-            from nltk.corpus import stopwords
-            from nltk.tokenize import word_tokenize
-            from nltk.probability import FreqDist
-            from collections import Counter
-            
-            # Download required NLTK data (if not already present)
-            try:
-                nltk.data.find('tokenizers/punkt')
-            except LookupError:
-                nltk.download('punkt')
-            
-            try:
-                nltk.data.find('corpora/stopwords')
-            except LookupError:
-                nltk.download('stopwords')
-            
-            # Tokenize and remove stopwords
-            tokens = word_tokenize(text.lower())
-            stop_words = set(stopwords.words('english'))
-            filtered_tokens = [word for word in tokens if word.isalpha() and word not in stop_words and len(word) > 2]
+            # Tokenize and remove stopwords in a single pass
+            filtered_tokens = (word for word in _WORD_RE.findall(text.lower()) if word not in _STOPWORDS)
             
             # Get most frequent words
-            freq_dist = Counter(filtered_tokens)
-            keywords = [word for word, _ in freq_dist.most_common(num_keywords)]
-            
-            return keywords
+            return [word for word, _ in Counter(filtered_tokens).most_common(num_keywords)]
         except Exception as e:
             print(f"Keyword extraction failed: {str(e)}")
             return []
@@ -174,13 +336,14 @@ class MediaBiasFactCheckClient:
         """
         try:
             # Check against known reliable/unreliable sources
-            if any(reliable in domain.lower() for reliable in Config.RELIABLE_SOURCES):
+            classification = _classify_domain(domain.lower())
+            if classification == 'reliable':
                 return {
                     "bias_rating": "minimal",
                     "credibility": "high",
                     "confidence": 0.8
                 }
-            elif any(unreliable in domain.lower() for unreliable in Config.UNRELIABLE_SOURCES):
+            elif classification == 'unreliable':
                 return {
                     "bias_rating": "high",
                     "credibility": "low",
@@ -208,37 +371,51 @@ class CrossReferenceClient:
             "similar_articles": [],
             "contradiction_indicators": [],
             "consensus_score": 0.0,
-            "source_diversity": 0
+            "source_diversity": 0,
+            "lookup_errors": []  # Configured searches that failed ('newsapi', 'google_search')
         }
         
         try:
-            # Search for similar articles using NewsAPI
-            news_results = self.news_api.search_articles(headline)
+            # Query NewsAPI and Google Custom Search concurrently
+            fut_news = _EXECUTOR.submit(self.news_api.search_articles, headline)
+            fut_google = _EXECUTOR.submit(self.google_search.search, headline)
+            
+            # Search for similar articles using NewsAPI; a failed or slow lookup only drops its own results
+            try:
+                news_results = fut_news.result(timeout=30)
+            except Exception as e:
+                news_results = {"status": "error", "message": f"NewsAPI lookup failed: {e!r}"}
+            if self.news_api.api_key and news_results.get("status") != "ok":
+                results["lookup_errors"].append("newsapi")
             
             if news_results.get("status") == "ok" and news_results.get("articles"):
-                similar_count = 0
-                sources = set()
+                similar = [
+                    {
+                        "title": article["title"],
+                        "source": article["source"]["name"],
+                        "url": article["url"],
+                        "published_at": article.get("publishedAt")
+                    }
+                    for article in news_results["articles"][:10]
+                    if article.get("title") and article.get("source")
+                ]
                 
-                for article in news_results["articles"][:10]:
-                    if article.get("title") and article.get("source"):
-                        sources.add(article["source"]["name"])
-                        similar_count += 1
-                        
-                        results["similar_articles"].append({
-                            "title": article["title"],
-                            "source": article["source"]["name"],
-                            "url": article["url"],
-                            "published_at": article.get("publishedAt")
-                        })
-                
-                results["source_diversity"] = len(sources)
-                results["consensus_score"] = min(similar_count / 5.0, 1.0)  # Normalize to 0-1
+                results["similar_articles"] = similar
+                results["source_diversity"] = len({article["source"] for article in similar})
+                results["consensus_score"] = min(len(similar) / 5.0, 1.0)  # Normalize to 0-1
             
             # Additional Google search for broader context
-            search_results = self.google_search.search(headline)
+            try:
+                search_results = fut_google.result(timeout=30)
+            except Exception as e:
+                search_results = {"status": "error", "message": f"Google search lookup failed: {e!r}"}
+            if (self.google_search.api_key and self.google_search.cse_id
+                    and ("error" in search_results or search_results.get("status") == "error")):
+                results["lookup_errors"].append("google_search")
             if search_results.get("items"):
                 for item in search_results["items"][:5]:
-                    domain = urlparse(item["link"]).netlify
+                    domain = parse_url(item["link"]).netloc
+                    domain = domain[4:] if domain.startswith('www.') else domain
                     results["similar_articles"].append({
                         "title": item["title"],
                         "source": domain,
@@ -4,19 +4,75 @@ Flask Web Application for Fake News Detector
 Provides a web interface for analyzing news articles
 """
 
-from flask import Flask, render_template, request, jsonify, flash
+from flask import Flask, render_template, request, flash
 import json
+import re
+import orjson
 from datetime import datetime
 from urllib.parse import urlparse
+import atexit
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 
 from news_analyzer import NewsAnalyzer, NewsAnalysisResult
 from config import Config
 
+# Static scraping headers; Accept-Encoding lists only the codecs urllib3 can decode here
+_UA_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+})
+
+# (connect, read) timeouts - fail fast on DNS/connect, allow longer for the body
+_SCRAPE_TIMEOUT = (3.05, 10)
+
+# Shared HTTP session for article extraction (keeps connections alive between requests)
+SESSION = requests.Session()
+SESSION.headers.update(_UA_HEADERS)
+# Retry a flaky article host once; a 429 or long Retry-After is not worth stalling the user for
+_retry = Retry(
+    total=1,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    respect_retry_after_header=False,
+    raise_on_status=False
+)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retry)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+atexit.register(SESSION.close)
+
+# http(s) scheme followed by a non-empty host; checked in one regex pass instead of urlparse
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+# Article extraction selectors, compiled once at import time
+# Title selectors are tried one at a time, in priority order
+_TITLE_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'title', 'h1', '.title', '.headline', '[property="og:title"]'
+))
+_CONTENT_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'article', '.article-content', '.post-content', '.entry-content',
+    '.story-content', 'main', '.main-content', '.content'
+))
+_UNWANTED_SELECTOR = soupsieve.compile('script, style, nav, footer, header, .advertisement')
+
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'  # Change this in production
 
+def _ojson(obj):
+    """Serialize a JSON response with orjson (faster than Flask's stdlib-based jsonify)"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
 # Initialize the analyzer
 analyzer = NewsAnalyzer()
 
@@ -32,23 +88,23 @@ def analyze():
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return _ojson({'error': 'No data provided'}), 400
         
         analysis_type = data.get('type')  # 'url' or 'text'
         
         if analysis_type == 'url':
             url = data.get('url', '').strip()
             if not url:
-                return jsonify({'error': 'URL is required'}), 400
+                return _ojson({'error': 'URL is required'}), 400
             
             if not is_valid_url(url):
-                return jsonify({'error': 'Invalid URL format'}), 400
+                return _ojson({'error': 'Invalid URL format'}), 400
             
             # Extract content from URL
             title, content = extract_article_from_url(url)
             
             if not title and not content:
-                return jsonify({'error': 'Could not extract content from URL'}), 400
+                return _ojson({'error': 'Could not extract content from URL'}), 400
             
             # Analyze the article
             result = analyzer.analyze_article(url=url, title=title, content=content)
@@ -58,43 +114,29 @@ def analyze():
             content = data.get('content', '').strip()
             
             if not title and not content:
-                return jsonify({'error': 'Either title or content is required'}), 400
+                return _ojson({'error': 'Either title or content is required'}), 400
             
             # Analyze the text
             result = analyzer.analyze_article(title=title, content=content)
         
         else:
-            return jsonify({'error': 'Invalid analysis type. Use "url" or "text"'}), 400
+            return _ojson({'error': 'Invalid analysis type. Use "url" or "text"'}), 400
         
         # Convert result to dictionary for JSON response
-        result_dict = {
-            'overall_credibility_score': result.overall_credibility_score,
-            'credibility_level': result.credibility_level,
-            'sentiment_analysis': result.sentiment_analysis,
-            'source_credibility': result.source_credibility,
-            'content_analysis': result.content_analysis,
-            'cross_reference_results': result.cross_reference_results,
-            'fact_check_results': result.fact_check_results,
-            'ai_analysis': result.ai_analysis,
-            'bias_indicators': result.bias_indicators,
-            'warning_flags': result.warning_flags,
-            'recommendations': result.recommendations,
-            'confidence_score': result.confidence_score,
-            'analysis_timestamp': result.analysis_timestamp
-        }
+        result_dict = result.to_dict()
         
-        return jsonify({
+        return _ojson({
             'success': True,
             'result': result_dict
         })
     
     except Exception as e:
-        return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
+        return _ojson({'error': f'Analysis failed: {str(e)}'}), 500
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return _ojson({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'version': '1.0.0'
@@ -103,44 +145,48 @@ def health_check():
 def extract_article_from_url(url: str) -> tuple:
     """Extract title and content from a news article URL"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        with SESSION.get(url, timeout=_SCRAPE_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('content-type', '')
+            if content_type and 'html' not in content_type:
+                raise ValueError(f"Unsupported content type: {content_type}")
+            
+            # Read at most MAX_ARTICLE_BYTES so oversized pages can't blow up memory or parse time
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= Config.MAX_ARTICLE_BYTES:
+                    break
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html_bytes = b''.join(chunks)[:Config.MAX_ARTICLE_BYTES]
+        soup = BeautifulSoup(html_bytes, 'lxml')
         
-        # Try to extract title
+        # Try to extract title (first selector, by priority, with non-empty text)
         title = None
-        title_tags = ['title', 'h1', '.title', '.headline', '[property="og:title"]']
-        for tag in title_tags:
-            element = soup.select_one(tag)
-            if element:
-                title = element.get_text().strip()
+        for selector in _TITLE_SELECTORS:
+            element = selector.select_one(soup)
+            text = element.get_text().strip() if element else ''
+            if text:
+                title = text
                 break
         
         # Try to extract main content
         content = None
-        content_selectors = [
-            'article', '.article-content', '.post-content', '.entry-content',
-            '.story-content', 'main', '.main-content', '.content'
-        ]
-        
-        for selector in content_selectors:
-            element = soup.select_one(selector)
+        for selector in _CONTENT_SELECTORS:
+            element = selector.select_one(soup)
             if element:
                 # Remove unwanted elements
-                for unwanted in element.select('script, style, nav, footer, header, .advertisement'):
+                for unwanted in _UNWANTED_SELECTOR.select(element):
                     unwanted.decompose()
                 content = element.get_text().strip()
                 break
         
         # If no content found, try paragraphs
         if not content:
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                content = ' '.join([p.get_text().strip() for p in paragraphs[:10]])  # First 10 paragraphs
+            content = _join_paragraphs(soup, limit_n=10) or None  # First 10 paragraphs
         
         return title, content
         
@@ -148,13 +194,25 @@ def extract_article_from_url(url: str) -> tuple:
         print(f"Error extracting article from URL: {str(e)}")
         return None, None
 
+def _join_paragraphs(soup: BeautifulSoup, limit_n: int, limit_chars: int = 5000) -> str:
+    """Join text from the first non-empty paragraphs, stopping the walk once enough is collected"""
+    parts = []
+    total = 0
+    for element in soup.descendants:
+        if element.name != 'p':
+            continue
+        text = element.get_text().strip()
+        if not text:
+            continue
+        parts.append(text)
+        total += len(text)
+        if len(parts) >= limit_n or total >= limit_chars:
+            break
+    return ' '.join(parts)
+
 def is_valid_url(url: str) -> bool:
     """Check if string is a valid URL"""
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
-    except:
-        return False
+    return bool(_URL_RE.match(url))
 
 if __name__ == '__main__':
     app.run(
@@ -4,31 +4,94 @@ Professional Flask Web Application for Fake News Detector
 Enhanced with real-time live news detection and professional UI
 """
 
-from flask import Flask, render_template, request, jsonify, flash
+from flask import Flask, render_template, request, flash
 from flask_socketio import SocketIO, emit
 import json
+import re
+import orjson
 import threading
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
+import atexit
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 import schedule
 
 from news_analyzer import NewsAnalyzer, NewsAnalysisResult
 from config import Config
 from logger import FakeNewsDetectorLogger
 
+# Static scraping headers; Accept-Encoding lists only the codecs urllib3 can decode here
+_UA_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+})
+
+# (connect, read) timeouts - fail fast on DNS/connect, allow longer for the body
+_SCRAPE_TIMEOUT = (3.05, 15)
+
+# Shared HTTP session for article extraction (keeps connections alive between requests)
+SESSION = requests.Session()
+SESSION.headers.update(_UA_HEADERS)
+# Retry a flaky article host once; a 429 or long Retry-After is not worth stalling the user for
+_retry = Retry(
+    total=1,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    respect_retry_after_header=False,
+    raise_on_status=False
+)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retry)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+atexit.register(SESSION.close)
+
+# http(s) scheme followed by a non-empty host; checked in one regex pass instead of urlparse
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+# Article extraction selectors, compiled once at import time
+# Title selectors are tried one at a time, in priority order
+_TITLE_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'title', 'h1', '.title', '.headline', '.entry-title',
+    '[property="og:title"]', '[name="twitter:title"]'
+))
+_CONTENT_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'article', '.article-content', '.post-content', '.entry-content',
+    '.story-content', '.article-body', 'main', '.main-content',
+    '.content', '.story', '.post-body'
+))
+_UNWANTED_SELECTOR = soupsieve.compile(
+    'script, style, nav, footer, header, .advertisement, .ads, .social-share'
+)
+
 app = Flask(__name__)
 app.secret_key = 'professional-fake-news-detector-2025'
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+def _ojson(obj):
+    """Serialize a JSON response with orjson (faster than Flask's stdlib-based jsonify)"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
 # Initialize components
 analyzer = NewsAnalyzer()
 logger = FakeNewsDetectorLogger()
 
 # Global variables for live monitoring
-live_monitoring_active = False
+# Set while monitoring is stopped; waiting on it lets a stop request interrupt any pause
+_stop_event = threading.Event()
+_stop_event.set()
 monitored_sources = [
     {'name': 'BBC News', 'rss': 'http://feeds.bbci.co.uk/news/rss.xml', 'domain': 'bbc.com'},
     {'name': 'Reuters', 'rss': 'https://www.reuters.com/rssFeed/topNews', 'domain': 'reuters.com'},
@@ -37,7 +100,9 @@ monitored_sources = [
     {'name': 'NPR', 'rss': 'https://feeds.npr.org/1001/rss.xml', 'domain': 'npr.org'}
 ]
 
-recent_analyses = []
+# Bounded history of recent analyses; written from request handlers and the monitoring thread
+recent_analyses = deque(maxlen=100)
+recent_analyses_lock = threading.Lock()
 live_stats = {
     'total_analyzed': 0,
     'high_credibility': 0,
@@ -50,9 +115,12 @@ live_stats = {
 @app.route('/')
 def dashboard():
     """Professional dashboard with live monitoring"""
+    with recent_analyses_lock:
+        latest = list(recent_analyses)[-10:]  # Show last 10
+    
     return render_template('dashboard.html', 
                          live_stats=live_stats,
-                         recent_analyses=recent_analyses[-10:],  # Show last 10
+                         recent_analyses=latest,
                          monitored_sources=monitored_sources)
 
 @app.route('/analyze', methods=['POST'])
@@ -62,23 +130,23 @@ def analyze():
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return _ojson({'error': 'No data provided'}), 400
         
         analysis_type = data.get('type')
         
         if analysis_type == 'url':
             url = data.get('url', '').strip()
             if not url:
-                return jsonify({'error': 'URL is required'}), 400
+                return _ojson({'error': 'URL is required'}), 400
             
             if not is_valid_url(url):
-                return jsonify({'error': 'Invalid URL format'}), 400
+                return _ojson({'error': 'Invalid URL format'}), 400
             
             # Extract content from URL
             title, content = extract_article_from_url(url)
             
             if not title and not content:
-                return jsonify({'error': 'Could not extract content from URL'}), 400
+                return _ojson({'error': 'Could not extract content from URL'}), 400
             
             # Analyze the article
             result = analyzer.analyze_article(url=url, title=title, content=content)
@@ -88,13 +156,13 @@ def analyze():
             content = data.get('content', '').strip()
             
             if not title and not content:
-                return jsonify({'error': 'Either title or content is required'}), 400
+                return _ojson({'error': 'Either title or content is required'}), 400
             
             # Analyze the text
             result = analyzer.analyze_article(title=title, content=content)
         
         else:
-            return jsonify({'error': 'Invalid analysis type. Use "url" or "text"'}), 400
+            return _ojson({'error': 'Invalid analysis type. Use "url" or "text"'}), 400
         
         # Log the analysis
         logger.log_analysis_complete(result, analysis_type, 
@@ -111,21 +179,7 @@ def analyze():
                              title=title if 'title' in locals() else data.get('title'))
         
         # Convert result to dictionary for JSON response
-        result_dict = {
-            'overall_credibility_score': result.overall_credibility_score,
-            'credibility_level': result.credibility_level,
-            'sentiment_analysis': result.sentiment_analysis,
-            'source_credibility': result.source_credibility,
-            'content_analysis': result.content_analysis,
-            'cross_reference_results': result.cross_reference_results,
-            'fact_check_results': result.fact_check_results,
-            'ai_analysis': result.ai_analysis,
-            'bias_indicators': result.bias_indicators,
-            'warning_flags': result.warning_flags,
-            'recommendations': result.recommendations,
-            'confidence_score': result.confidence_score,
-            'analysis_timestamp': result.analysis_timestamp
-        }
+        result_dict = result.to_dict()
         
         # Emit real-time update to dashboard
         socketio.emit('new_analysis', {
@@ -134,41 +188,41 @@ def analyze():
             'timestamp': datetime.now().isoformat()
         })
         
-        return jsonify({
+        return _ojson({
             'success': True,
             'result': result_dict
         })
     
     except Exception as e:
         logger.log_error(e, "analysis endpoint")
-        return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
+        return _ojson({'error': f'Analysis failed: {str(e)}'}), 500
 
 @app.route('/live-monitoring', methods=['POST'])
 def toggle_live_monitoring():
     """Start/stop live news monitoring"""
-    global live_monitoring_active
-    
     action = request.json.get('action')
     
     if action == 'start':
-        live_monitoring_active = True
+        _stop_event.clear()
         start_live_monitoring()
-        return jsonify({'status': 'started', 'message': 'Live monitoring started'})
+        return _ojson({'status': 'started', 'message': 'Live monitoring started'})
     elif action == 'stop':
-        live_monitoring_active = False
-        return jsonify({'status': 'stopped', 'message': 'Live monitoring stopped'})
+        _stop_event.set()
+        return _ojson({'status': 'stopped', 'message': 'Live monitoring stopped'})
     else:
-        return jsonify({'error': 'Invalid action. Use "start" or "stop"'}), 400
+        return _ojson({'error': 'Invalid action. Use "start" or "stop"'}), 400
 
 @app.route('/stats')
 def get_stats():
     """Get current statistics"""
-    return jsonify(live_stats)
+    return _ojson(live_stats)
 
 @app.route('/recent-analyses')
 def get_recent_analyses():
     """Get recent analyses"""
-    return jsonify(recent_analyses[-20:])  # Last 20 analyses
+    with recent_analyses_lock:
+        latest = list(recent_analyses)[-20:]  # Last 20 analyses
+    return _ojson(latest)
 
 @socketio.on('connect')
 def handle_connect():
@@ -183,41 +237,42 @@ def handle_stats_request():
 def extract_article_from_url(url: str) -> tuple:
     """Enhanced content extraction with better error handling"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        with SESSION.get(url, timeout=_SCRAPE_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('content-type', '')
+            if content_type and 'html' not in content_type:
+                raise ValueError(f"Unsupported content type: {content_type}")
+            
+            # Read at most MAX_ARTICLE_BYTES so oversized pages can't blow up memory or parse time
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= Config.MAX_ARTICLE_BYTES:
+                    break
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html_bytes = b''.join(chunks)[:Config.MAX_ARTICLE_BYTES]
+        soup = BeautifulSoup(html_bytes, 'lxml')
         
-        # Enhanced title extraction
+        # Enhanced title extraction, by selector priority, skipping empty matches
         title = None
-        title_selectors = [
-            'title', 'h1', '.title', '.headline', '.entry-title',
-            '[property="og:title"]', '[name="twitter:title"]'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text().strip()
-                if title and len(title) > 10:  # Ensure meaningful title
+        for selector in _TITLE_SELECTORS:
+            element = selector.select_one(soup)
+            text = element.get_text().strip() if element else ''
+            if text:
+                title = text
+                if len(title) > 10:  # Ensure meaningful title
                     break
         
         # Enhanced content extraction
         content = None
-        content_selectors = [
-            'article', '.article-content', '.post-content', '.entry-content',
-            '.story-content', '.article-body', 'main', '.main-content', 
-            '.content', '.story', '.post-body'
-        ]
-        
-        for selector in content_selectors:
-            element = soup.select_one(selector)
+        for selector in _CONTENT_SELECTORS:
+            element = selector.select_one(soup)
             if element:
                 # Remove unwanted elements
-                for unwanted in element.select('script, style, nav, footer, header, .advertisement, .ads, .social-share'):
+                for unwanted in _UNWANTED_SELECTOR.select(element):
                     unwanted.decompose()
                 content = element.get_text().strip()
                 if content and len(content) > 100:  # Ensure substantial content
@@ -225,9 +280,7 @@ def extract_article_from_url(url: str) -> tuple:
         
         # Fallback to paragraphs if no content found
         if not content:
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                content = ' '.join([p.get_text().strip() for p in paragraphs[:15]])
+            content = _join_paragraphs(soup, limit_n=15) or None  # First 15 paragraphs
         
         return title, content
         
@@ -235,13 +288,25 @@ def extract_article_from_url(url: str) -> tuple:
         logger.log_error(e, f"URL extraction: {url}")
         return None, None
 
+def _join_paragraphs(soup: BeautifulSoup, limit_n: int, limit_chars: int = 5000) -> str:
+    """Join text from the first non-empty paragraphs, stopping the walk once enough is collected"""
+    parts = []
+    total = 0
+    for element in soup.descendants:
+        if element.name != 'p':
+            continue
+        text = element.get_text().strip()
+        if not text:
+            continue
+        parts.append(text)
+        total += len(text)
+        if len(parts) >= limit_n or total >= limit_chars:
+            break
+    return ' '.join(parts)
+
 def is_valid_url(url: str) -> bool:
     """Enhanced URL validation"""
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
-    except:
-        return False
+    return bool(_URL_RE.match(url))
 
 def update_live_stats(result: NewsAnalysisResult):
     """Update live statistics"""
@@ -263,8 +328,6 @@ def update_live_stats(result: NewsAnalysisResult):
 
 def add_to_recent_analyses(result: NewsAnalysisResult, analysis_type: str, url: str = None, title: str = None):
     """Add analysis to recent analyses list"""
-    global recent_analyses
-    
     analysis_summary = {
         'timestamp': result.analysis_timestamp,
         'type': analysis_type,
@@ -276,18 +339,27 @@ def add_to_recent_analyses(result: NewsAnalysisResult, analysis_type: str, url:
         'bias_count': len(result.bias_indicators)
     }
     
-    recent_analyses.append(analysis_summary)
-    
-    # Keep only last 100 analyses
-    if len(recent_analyses) > 100:
-        recent_analyses = recent_analyses[-100:]
+    # The deque evicts the oldest entry once 100 analyses are stored
+    with recent_analyses_lock:
+        recent_analyses.append(analysis_summary)
+
+# Per-feed (etag, modified) validators and last parsed headlines, used for conditional GETs
+_feed_state = {}
+_feed_headlines = {}
 
 def fetch_rss_headlines(rss_url: str, source_name: str) -> list:
     """Fetch headlines from RSS feed"""
     try:
         import feedparser
         
-        feed = feedparser.parse(rss_url)
+        etag, modified = _feed_state.get(rss_url, (None, None))
+        feed = feedparser.parse(rss_url, etag=etag, modified=modified)
+        
+        # Feed unchanged since the last fetch - reuse the headlines parsed then
+        if getattr(feed, 'status', None) == 304:
+            return _feed_headlines.get(rss_url, [])
+        
+        _feed_state[rss_url] = (getattr(feed, 'etag', None), getattr(feed, 'modified', None))
         headlines = []
         
         for entry in feed.entries[:10]:  # Get latest 10 entries
@@ -298,6 +370,7 @@ def fetch_rss_headlines(rss_url: str, source_name: str) -> list:
                 'source': source_name
             })
         
+        _feed_headlines[rss_url] = headlines
         return headlines
     except Exception as e:
         logger.log_error(e, f"RSS fetch: {rss_url}")
@@ -305,19 +378,29 @@ def fetch_rss_headlines(rss_url: str, source_name: str) -> list:
 
 def analyze_live_news():
     """Analyze live news from RSS feeds"""
-    global live_monitoring_active
+    consecutive_failures = 0
     
-    while live_monitoring_active:
+    while not _stop_event.is_set():
         try:
-            for source in monitored_sources:
-                if not live_monitoring_active:
-                    break
-                
-                headlines = fetch_rss_headlines(source['rss'], source['name'])
+            # Fetch all feeds in parallel - they are independent network reads
+            with ThreadPoolExecutor(max_workers=len(monitored_sources)) as executor:
+                headline_lists = list(executor.map(
+                    lambda source: fetch_rss_headlines(source['rss'], source['name']),
+                    monitored_sources
+                ))
+            
+            # Back off when every feed came back empty (network or upstream trouble)
+            if not any(headline_lists):
+                raise RuntimeError("No headlines fetched from any monitored source")
+            consecutive_failures = 0
+            
+            for headlines in headline_lists:
+                if _stop_event.is_set():
+                    return
                 
                 for headline in headlines[:3]:  # Analyze top 3 from each source
-                    if not live_monitoring_active:
-                        break
+                    if _stop_event.is_set():
+                        return
                     
                     try:
                         # Analyze the headline
@@ -344,31 +427,29 @@ def analyze_live_news():
                             'timestamp': datetime.now().isoformat()
                         })
                         
-                        # Rate limiting to avoid overwhelming APIs
-                        time.sleep(5)
-                        
                     except Exception as e:
                         logger.log_error(e, f"Live analysis: {headline['title']}")
                         continue
-                
-                # Wait between sources
-                time.sleep(10)
             
-            # Wait 5 minutes before next cycle
-            if live_monitoring_active:
-                time.sleep(300)
+            # Wait 5 minutes before next cycle (returns immediately if stopped)
+            if _stop_event.wait(300):
+                return
                 
         except Exception as e:
             logger.log_error(e, "Live monitoring")
-            time.sleep(60)
+            
+            # Exponential backoff on repeated failures: 60s, 120s, 240s ... capped at 30 minutes
+            consecutive_failures += 1
+            if _stop_event.wait(min(60 * 2 ** (consecutive_failures - 1), 1800)):
+                return
 
 def start_live_monitoring():
     """Start live monitoring in background thread"""
-    if not live_monitoring_active:
+    if _stop_event.is_set():
         return
     
-    monitoring_thread = threading.Thread(target=analyze_live_news, daemon=True)
-    monitoring_thread.start()
+    # Let Flask-SocketIO pick the task primitive that matches its async mode
+    socketio.start_background_task(analyze_live_news)
 
 # Install feedparser if not already installed
 try:
@@ -5,63 +5,159 @@ Provides interactive CLI for analyzing news articles
 """
 
 import argparse
+import atexit
+import functools
+import hashlib
+import io
 import sys
 import json
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from urllib.parse import urlparse
-import requests
-from bs4 import BeautifulSoup
 
-from news_analyzer import NewsAnalyzer, NewsAnalysisResult
+# C-implemented JSON encoder for --output exports; stdlib json is used when it is unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import Config
 
+# requests, bs4, trafilatura and the analyzer (NLTK, TextBlob, API clients) are imported on
+# first use so that --help and argument errors do not pay their import cost
+if TYPE_CHECKING:
+    from news_analyzer import NewsAnalyzer, NewsAnalysisResult
+
+_RULE = "=" * 80
+
+# Marks a lazily built NewsDetectorCLI member that has not been created yet
+_UNSET = object()
+
+@functools.lru_cache(maxsize=None)
+def _compiled_selectors():
+    """Compile the extraction selectors once, on first use (soupsieve imports bs4)"""
+    import soupsieve
+    return (
+        tuple(soupsieve.compile(s) for s in NewsDetectorCLI._TITLE_SELECTORS),
+        tuple(soupsieve.compile(s) for s in NewsDetectorCLI._CONTENT_SELECTORS),
+        soupsieve.compile(NewsDetectorCLI._UNWANTED_SELECTOR),
+    )
+
+@functools.lru_cache(maxsize=None)
+def _load_trafilatura():
+    """Import trafilatura once, returning None so the selector heuristics are used if it is missing"""
+    try:
+        import trafilatura
+        return trafilatura
+    except ImportError:
+        return None
+
 class NewsDetectorCLI:
     """Command line interface for the fake news detector"""
     
+    # Extraction selectors in priority order
+    _TITLE_SELECTORS = ('title', 'h1', '.title', '.headline', '[property="og:title"]')
+    _CONTENT_SELECTORS = (
+        'article', '.article-content', '.post-content', '.entry-content',
+        '.story-content', 'main', '.main-content', '.content'
+    )
+    _UNWANTED_SELECTOR = 'script, style, nav, footer, header, .advertisement'
+    
+    __slots__ = ('_analyzer', '_session', '_cache')
+    
     def __init__(self):
-        self.analyzer = NewsAnalyzer()
+        # Heavy members are built lazily by the properties below
+        self._analyzer = _UNSET
+        self._session = _UNSET
+        self._cache = _UNSET
+    
+    @property
+    def analyzer(self) -> 'NewsAnalyzer':
+        """News analyzer, created on first analysis"""
+        if self._analyzer is _UNSET:
+            from news_analyzer import NewsAnalyzer
+            self._analyzer = NewsAnalyzer()
+        return self._analyzer
+    
+    @property
+    def session(self):
+        """Pooled session so consecutive URL analyses reuse keep-alive connections"""
+        if self._session is _UNSET:
+            self._session = self._build_session()
+        return self._session
+    
+    @property
+    def cache(self):
+        """On-disk cache of extracted articles (optional - None if diskcache is missing)"""
+        if self._cache is _UNSET:
+            self._cache = self._open_cache()
+        return self._cache
+    
+    @staticmethod
+    def _build_session():
+        """Create the HTTP session used for article downloads"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import make_headers
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        # Advertise only the codecs urllib3 can decode here (br once brotli is installed)
+        session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        atexit.register(session.close)
+        return session
+    
+    @staticmethod
+    def _open_cache():
+        """Open the article cache, returning None if diskcache is unavailable"""
+        try:
+            import diskcache
+            cache = diskcache.Cache(Config.ARTICLE_CACHE_DIR)
+            atexit.register(cache.close)
+            return cache
+        except Exception:
+            return None
     
     def extract_article_from_url(self, url: str) -> tuple[Optional[str], Optional[str]]:
         """Extract title and content from a news article URL"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Try to extract title
-            title = None
-            title_tags = ['title', 'h1', '.title', '.headline', '[property="og:title"]']
-            for tag in title_tags:
-                element = soup.select_one(tag)
-                if element:
-                    title = element.get_text().strip()
-                    break
-            
-            # Try to extract main content
-            content = None
-            content_selectors = [
-                'article', '.article-content', '.post-content', '.entry-content',
-                '.story-content', 'main', '.main-content', '.content'
-            ]
+            # Revalidate a previously extracted copy instead of downloading it again
+            cache_key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+            cached = self.cache.get(cache_key) if self.cache is not None else None
+            headers = {}
+            if cached:
+                if cached[2]:
+                    headers['If-None-Match'] = cached[2]
+                if cached[3]:
+                    headers['If-Modified-Since'] = cached[3]
             
-            for selector in content_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    # Remove unwanted elements
-                    for unwanted in element.select('script, style, nav, footer, header, .advertisement'):
-                        unwanted.decompose()
-                    content = element.get_text().strip()
-                    break
+            # Stream the body and stop reading once MAX_ARTICLE_BYTES have arrived
+            buf = bytearray()
+            with self.session.get(url, headers=headers, timeout=10, stream=True) as response:
+                if cached and response.status_code == 304:
+                    return cached[0], cached[1]
+                response.raise_for_status()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                for chunk in response.iter_content(chunk_size=65536):
+                    buf.extend(chunk)
+                    if len(buf) >= Config.MAX_ARTICLE_BYTES:
+                        break
             
-            # If no content found, try paragraphs
+            html_bytes = bytes(buf[:Config.MAX_ARTICLE_BYTES])
+            title, content = self._extract_with_trafilatura(html_bytes)
             if not content:
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    content = ' '.join([p.get_text().strip() for p in paragraphs[:10]])  # First 10 paragraphs
+                title, content = self._extract_with_soup(html_bytes)
+            
+            if self.cache is not None and (title or content):
+                self.cache.set(cache_key, (title, content, etag, last_modified), expire=Config.ARTICLE_CACHE_TTL)
             
             return title, content
             
@@ -69,110 +165,180 @@ class NewsDetectorCLI:
             print(f"Error extracting article from URL: {str(e)}")
             return None, None
     
-    def format_analysis_result(self, result: NewsAnalysisResult) -> str:
+    @staticmethod
+    def _extract_with_trafilatura(html_bytes: bytes) -> tuple[Optional[str], Optional[str]]:
+        """Extract title and main text with trafilatura, returning (None, None) if it finds nothing"""
+        trafilatura = _load_trafilatura()
+        if trafilatura is None:
+            return None, None
+        
+        result = trafilatura.bare_extraction(
+            html_bytes, with_metadata=True, include_comments=False, favor_precision=True
+        )
+        if result is None:
+            return None, None
+        if not isinstance(result, dict):  # trafilatura >= 2.0 returns a Document
+            result = result.as_dict()
+        return result.get('title'), result.get('text')
+    
+    def _extract_with_soup(self, html_bytes: bytes) -> tuple[Optional[str], Optional[str]]:
+        """Fallback extraction using the selector heuristics"""
+        from bs4 import BeautifulSoup, FeatureNotFound
+        title_selectors, content_selectors, unwanted_selector = _compiled_selectors()
+        
+        # Parse with the C-backed lxml parser when available
+        try:
+            soup = BeautifulSoup(html_bytes, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(html_bytes, 'html.parser')
+        
+        # Try to extract title (first selector, by priority, with non-empty text)
+        title = None
+        for selector in title_selectors:
+            match = selector.select(soup, limit=1)
+            text = match[0].get_text().strip() if match else ''
+            if text:
+                title = text
+                break
+        
+        # Remove unwanted elements in one document-wide pass (after the title, which may live in a <header>)
+        for unwanted in unwanted_selector.select(soup):
+            unwanted.decompose()
+        
+        # Try to extract main content
+        content = None
+        for selector in content_selectors:
+            match = selector.select(soup, limit=1)
+            if match:
+                content = match[0].get_text(' ', strip=True)
+                break
+        
+        # If no content found, try paragraphs
+        if not content:
+            paragraphs = soup.find_all('p')
+            if paragraphs:
+                content = ' '.join([p.get_text().strip() for p in paragraphs[:10]])  # First 10 paragraphs
+        
+        return title, content
+    
+    def format_analysis_result(self, result: 'NewsAnalysisResult') -> str:
         """Format the analysis result for display"""
-        output = []
-        output.append("=" * 80)
-        output.append("FAKE NEWS DETECTOR - ANALYSIS RESULTS")
-        output.append("=" * 80)
+        buf = io.StringIO()
+        write = buf.write
+        write(_RULE + "\nFAKE NEWS DETECTOR - ANALYSIS RESULTS\n" + _RULE + "\n")
         
         # Overall score
-        output.append(f"\n📊 OVERALL CREDIBILITY: {result.credibility_level.upper()}")
-        output.append(f"📈 Credibility Score: {result.overall_credibility_score:.2f}/1.00")
-        output.append(f"🔍 Confidence Level: {result.confidence_score:.2f}/1.00")
+        write(f"\n📊 OVERALL CREDIBILITY: {result.credibility_level.upper()}\n")
+        write(f"📈 Credibility Score: {result.overall_credibility_score:.2f}/1.00\n")
+        write(f"🔍 Confidence Level: {result.confidence_score:.2f}/1.00\n")
         
         # Warning flags
         if result.warning_flags:
-            output.append("\n⚠️  WARNING FLAGS:")
+            write("\n⚠️  WARNING FLAGS:\n")
             for flag in result.warning_flags:
-                output.append(f"   • {flag}")
+                write(f"   • {flag}\n")
         
         # Source analysis
         if result.source_credibility:
-            output.append("\n🌐 SOURCE ANALYSIS:")
+            write("\n🌐 SOURCE ANALYSIS:\n")
             source = result.source_credibility
             if 'domain' in source:
-                output.append(f"   Domain: {source['domain']}")
+                write(f"   Domain: {source['domain']}\n")
             if 'is_https' in source:
-                output.append(f"   HTTPS: {'✓' if source['is_https'] else '✗'}")
+                write(f"   HTTPS: {'✓' if source['is_https'] else '✗'}\n")
             if 'bias_check' in source:
                 bias = source['bias_check']
-                output.append(f"   Credibility: {bias.get('credibility', 'Unknown')}")
-                output.append(f"   Bias Rating: {bias.get('bias_rating', 'Unknown')}")
+                write(f"   Credibility: {bias.get('credibility', 'Unknown')}\n")
+                write(f"   Bias Rating: {bias.get('bias_rating', 'Unknown')}\n")
         
         # Content analysis
         if result.content_analysis:
-            output.append("\n📝 CONTENT ANALYSIS:")
+            write("\n📝 CONTENT ANALYSIS:\n")
             content = result.content_analysis
-            output.append(f"   Word Count: {content.get('word_count', 'Unknown')}")
-            output.append(f"   Sentence Count: {content.get('sentence_count', 'Unknown')}")
+            write(f"   Word Count: {content.get('word_count', 'Unknown')}\n")
+            write(f"   Sentence Count: {content.get('sentence_count', 'Unknown')}\n")
             
             if content.get('keywords'):
-                output.append(f"   Keywords: {', '.join(content['keywords'][:5])}")
+                write(f"   Keywords: {', '.join(content['keywords'][:5])}\n")
             
             if content.get('suspicious_patterns'):
-                output.append("   Suspicious Patterns:")
+                write("   Suspicious Patterns:\n")
                 for pattern in content['suspicious_patterns']:
-                    output.append(f"     • {pattern}")
+                    write(f"     • {pattern}\n")
         
         # Sentiment analysis
         if result.sentiment_analysis and not result.sentiment_analysis.get('error'):
-            output.append("\n💭 SENTIMENT ANALYSIS:")
+            write("\n💭 SENTIMENT ANALYSIS:\n")
             sentiment = result.sentiment_analysis
-            output.append(f"   Overall Sentiment: {sentiment.get('sentiment', 'Unknown').title()}")
-            output.append(f"   Polarity: {sentiment.get('polarity', 0):.2f} (-1 to 1)")
-            output.append(f"   Subjectivity: {sentiment.get('subjectivity', 0):.2f} (0 to 1)")
+            write(f"   Overall Sentiment: {sentiment.get('sentiment', 'Unknown').title()}\n")
+            write(f"   Polarity: {sentiment.get('polarity', 0):.2f} (-1 to 1)\n")
+            write(f"   Subjectivity: {sentiment.get('subjectivity', 0):.2f} (0 to 1)\n")
         
         # Cross-reference results
         if result.cross_reference_results and not result.cross_reference_results.get('error'):
-            output.append("\n🔄 CROSS-REFERENCE CHECK:")
+            write("\n🔄 CROSS-REFERENCE CHECK:\n")
             cross_ref = result.cross_reference_results
-            output.append(f"   Consensus Score: {cross_ref.get('consensus_score', 0):.2f}/1.00")
-            output.append(f"   Source Diversity: {cross_ref.get('source_diversity', 0)} sources")
+            write(f"   Consensus Score: {cross_ref.get('consensus_score', 0):.2f}/1.00\n")
+            write(f"   Source Diversity: {cross_ref.get('source_diversity', 0)} sources\n")
             
             similar = cross_ref.get('similar_articles', [])
             if similar:
-                output.append(f"   Similar Articles Found: {len(similar)}")
+                write(f"   Similar Articles Found: {len(similar)}\n")
                 for i, article in enumerate(similar[:3], 1):
-                    output.append(f"     {i}. {article.get('source', 'Unknown')}: {article.get('title', '')[:60]}...")
+                    write(f"     {i}. {article.get('source', 'Unknown')}: {article.get('title', '')[:60]}...\n")
         
         # AI Analysis Results
         if result.ai_analysis and result.ai_analysis.get('status') == 'success':
-            output.append("\n🤖 AI ANALYSIS:")
+            write("\n🤖 AI ANALYSIS:\n")
             ai = result.ai_analysis
             if 'credibility_level' in ai:
-                output.append(f"   AI Assessment: {ai['credibility_level']}")
+                write(f"   AI Assessment: {ai['credibility_level']}\n")
             if 'credibility_score' in ai:
-                output.append(f"   AI Score: {ai['credibility_score']:.2f}/1.00")
+                write(f"   AI Score: {ai['credibility_score']:.2f}/1.00\n")
             if 'key_findings' in ai and ai['key_findings']:
-                output.append("   Key Findings:")
+                write("   Key Findings:\n")
                 for finding in ai['key_findings'][:3]:
-                    output.append(f"     • {finding}")
+                    write(f"     • {finding}\n")
             if 'red_flags' in ai and ai['red_flags']:
-                output.append("   AI Red Flags:")
+                write("   AI Red Flags:\n")
                 for flag in ai['red_flags'][:3]:
-                    output.append(f"     • {flag}")
+                    write(f"     • {flag}\n")
         
         # Bias indicators
         if result.bias_indicators:
-            output.append("\n🎯 BIAS INDICATORS:")
+            write("\n🎯 BIAS INDICATORS:\n")
             for indicator in result.bias_indicators[:5]:
-                output.append(f"   • {indicator}")
+                write(f"   • {indicator}\n")
             if len(result.bias_indicators) > 5:
-                output.append(f"   ... and {len(result.bias_indicators) - 5} more")
+                write(f"   ... and {len(result.bias_indicators) - 5} more\n")
         
         # Recommendations
-        output.append("\n💡 RECOMMENDATIONS:")
+        write("\n💡 RECOMMENDATIONS:\n")
         for rec in result.recommendations:
-            output.append(f"   • {rec}")
+            write(f"   • {rec}\n")
         
         # Timestamp
-        output.append(f"\n⏰ Analysis completed at: {result.analysis_timestamp}")
-        output.append("=" * 80)
+        write(f"\n⏰ Analysis completed at: {result.analysis_timestamp}\n")
+        write(_RULE)
         
-        return "\n".join(output)
+        return buf.getvalue()
     
-    def analyze_url(self, url: str) -> None:
+    def save_result(self, result: 'NewsAnalysisResult', path: str) -> None:
+        """Write the analysis result to a JSON file"""
+        data = result.to_dict()
+        if orjson is not None:
+            payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+        
+        try:
+            with open(path, 'wb') as f:
+                f.write(payload)
+            print(f"💾 Results saved to: {path}")
+        except OSError as e:
+            print(f"❌ Could not write results to {path}: {str(e)}")
+    
+    def analyze_url(self, url: str, output: Optional[str] = None) -> None:
         """Analyze a news article from URL"""
         print(f"\n🔍 Analyzing article from: {url}")
         print("📥 Extracting content...")
@@ -190,21 +356,33 @@ class NewsDetectorCLI:
         
         print("\n🤖 Analyzing...")
         try:
-            result = self.analyzer.analyze_article(url=url, title=title, content=content)
-            print(self.format_analysis_result(result))
+            if Config.FAST_PATH_ENABLED and Config.is_reliable(urlparse(url).hostname or ''):
+                print("✅ Known reliable source - skipping full analysis")
+                result = self.analyzer.assess_reliable_source(url, title)
+            else:
+                result = self.analyzer.analyze_article(url=url, title=title, content=content)
+            sys.stdout.write(self.format_analysis_result(result) + "\n")
         except Exception as e:
             print(f"❌ Analysis failed: {str(e)}")
+            return
+        
+        if output:
+            self.save_result(result, output)
     
-    def analyze_text(self, title: str, content: str = None) -> None:
+    def analyze_text(self, title: str, content: str = None, output: Optional[str] = None) -> None:
         """Analyze news text directly"""
         print(f"\n🔍 Analyzing text: {title[:100]}...")
         print("🤖 Analyzing...")
         
         try:
             result = self.analyzer.analyze_article(title=title, content=content)
-            print(self.format_analysis_result(result))
+            sys.stdout.write(self.format_analysis_result(result) + "\n")
         except Exception as e:
             print(f"❌ Analysis failed: {str(e)}")
+            return
+        
+        if output:
+            self.save_result(result, output)
     
     def interactive_mode(self) -> None:
         """Run interactive mode"""
@@ -215,31 +393,17 @@ class NewsDetectorCLI:
             try:
                 user_input = input("fake-news-detector> ").strip()
                 
-                if user_input.lower() in ['exit', 'quit', 'q']:
-                    print("👋 Goodbye!")
-                    break
-                elif user_input.lower() in ['help', 'h']:
-                    self.show_help()
-                elif user_input.startswith('url '):
-                    url = user_input[4:].strip()
-                    if self.is_valid_url(url):
-                        self.analyze_url(url)
-                    else:
-                        print("❌ Invalid URL format")
-                elif user_input.startswith('text '):
-                    text = user_input[5:].strip()
-                    if text:
-                        self.analyze_text(text)
-                    else:
-                        print("❌ Please provide text to analyze")
+                # Bare words (any case) are commands only on their own; 'url '/'text ' prefixes are
+                # case-sensitive, so headlines like "Exit polls ..." fall through to analysis
+                cmd, sep, arg = user_input.partition(' ')
+                if sep:
+                    handler = self._ARG_COMMANDS.get(cmd)
                 else:
-                    # Assume it's a URL or text
-                    if self.is_valid_url(user_input):
-                        self.analyze_url(user_input)
-                    elif user_input:
-                        self.analyze_text(user_input)
-                    else:
-                        print("❌ Please provide a URL or text to analyze. Type 'help' for instructions.")
+                    handler = self._COMMANDS.get(cmd.lower())
+                if handler is None:
+                    self._cmd_default(user_input)
+                elif handler(self, arg.strip()):
+                    break
             
             except KeyboardInterrupt:
                 print("\n👋 Goodbye!")
@@ -247,6 +411,49 @@ class NewsDetectorCLI:
             except Exception as e:
                 print(f"❌ Error: {str(e)}")
     
+    def _cmd_exit(self, arg: str) -> bool:
+        """Leave interactive mode"""
+        print("👋 Goodbye!")
+        return True
+    
+    def _cmd_help(self, arg: str) -> None:
+        """Show help from interactive mode"""
+        self.show_help()
+    
+    def _cmd_url(self, url: str) -> None:
+        """Analyze a URL given with the 'url' command"""
+        if self.is_valid_url(url):
+            self.analyze_url(url)
+        else:
+            print("❌ Invalid URL format")
+    
+    def _cmd_text(self, text: str) -> None:
+        """Analyze text given with the 'text' command"""
+        if text:
+            self.analyze_text(text)
+        else:
+            print("❌ Please provide text to analyze")
+    
+    def _cmd_default(self, user_input: str) -> None:
+        """Treat input without a command word as a URL or text"""
+        if self.is_valid_url(user_input):
+            self.analyze_url(user_input)
+        elif user_input:
+            self.analyze_text(user_input)
+        else:
+            print("❌ Please provide a URL or text to analyze. Type 'help' for instructions.")
+    
+    # Interactive command words, looked up once per input line; a true return ends the session.
+    # _COMMANDS are whole-line commands, _ARG_COMMANDS prefix an argument.
+    _COMMANDS = {
+        'exit': _cmd_exit, 'quit': _cmd_exit, 'q': _cmd_exit,
+        'help': _cmd_help, 'h': _cmd_help,
+    }
+    _ARG_COMMANDS = {
+        'url': _cmd_url,
+        'text': _cmd_text,
+    }
+    
     def show_help(self) -> None:
         """Show help information"""
         print("""
@@ -269,12 +476,15 @@ class NewsDetectorCLI:
    text Breaking: Major event happens in city
    """)
     
-    def is_valid_url(self, url: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def is_valid_url(url: str) -> bool:
         """Check if string is a valid URL"""
+        if not url.startswith(('http://', 'https://')):
+            return False
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
-        except:
+            return bool(urlparse(url).netloc)
+        except ValueError:
             return False
 
 def main():
@@ -295,6 +505,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Redirected stdout is block-buffered; make sure buffered results reach the file on exit
+    if not sys.stdout.isatty():
+        atexit.register(sys.stdout.flush)
+    
     cli = NewsDetectorCLI()
     
     # Check if no arguments provided
@@ -307,11 +521,11 @@ def main():
         if not cli.is_valid_url(args.url):
             print("❌ Invalid URL format")
             sys.exit(1)
-        cli.analyze_url(args.url)
+        cli.analyze_url(args.url, args.output)
     
     # Text analysis
     elif args.text:
-        cli.analyze_text(args.text, args.title)
+        cli.analyze_text(args.text, args.title, args.output)
     
     else:
         print("❌ Please provide either --url, --text, or use --interactive mode")
@@ -3,7 +3,13 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-class Config:
+class _ReadOnlyMeta(type):
+    """Metaclass that rejects attribute assignment on the class after creation"""
+    
+    def __setattr__(cls, name, value):
+        raise AttributeError(f"{cls.__name__}.{name} is read-only")
+
+class Config(metaclass=_ReadOnlyMeta):
     """Configuration class for the Fake News Detector"""
     
     # API Keys
@@ -17,6 +23,26 @@ class Config:
     # Application Settings
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
     PORT = int(os.getenv('PORT', 5000))
+    # Give known-reliable domains a source-only verdict in the CLI, skipping the full pipeline
+    FAST_PATH_ENABLED = os.getenv('FAST_PATH_ENABLED', 'False').lower() == 'true'
+    
+    # Response cache settings (seconds) for read-only API lookups
+    API_CACHE_TTL = int(os.getenv('API_CACHE_TTL', 600))
+    # Shared on-disk cache for fact-check lookups, reused across processes and restarts
+    LOOKUP_CACHE_DIR = os.getenv('LOOKUP_CACHE_DIR', '.cache/lookups')
+    LOOKUP_CACHE_TTL = int(os.getenv('LOOKUP_CACHE_TTL', 86400))
+    # Seconds a complete article analysis is reused for identical url/title/content
+    RESULT_CACHE_TTL = int(os.getenv('RESULT_CACHE_TTL', 3600))
+    
+    # Client-side rate limits (requests per second, burst size) per provider
+    NEWS_API_RATE = (1.0, 5)
+    GOOGLE_CSE_RATE = (0.1, 3)
+    FACT_CHECK_RATE = (1.0, 5)
+    # Longest a lookup waits for a rate-limit slot before giving up (seconds); kept well under
+    # the 30s cross-reference timeout so a queued search fails on its own instead of stalling
+    RATE_LIMIT_WAIT = 15
+    # Upper bound on a provider's Retry-After header before an API retry (seconds)
+    MAX_RETRY_AFTER = 5
     
     # API URLs
     NEWS_API_URL = "https://newsapi.org/v2"
@@ -29,22 +55,51 @@ class Config:
     MEDIUM_CREDIBILITY_THRESHOLD = 0.5
     LOW_CREDIBILITY_THRESHOLD = 0.3
     
+    # Article extraction limits
+    MAX_ARTICLE_BYTES = 2_000_000  # Stop downloading page bodies beyond this size
+    ARTICLE_CACHE_DIR = os.getenv('ARTICLE_CACHE_DIR', '.cache/articles')
+    ARTICLE_CACHE_TTL = 86400  # Seconds an extracted article is kept for revalidation
+    
+    # Pattern and ratio analysis covers at most this many characters of an article (its head
+    # and tail); longer bodies are sampled rather than scanned in full
+    MAX_ANALYZE_CHARS = 20000
+    # Below this many content words (and without a title of MIN_TITLE_WORDS) the Gemini
+    # analysis is skipped - there is too little text for a meaningful verdict
+    MIN_CONTENT_WORDS = 20
+    MIN_TITLE_WORDS = 3
+    
     # Known reliable news sources (can be expanded)
-    RELIABLE_SOURCES = [
+    RELIABLE_SOURCES = frozenset({
         'reuters.com', 'ap.org', 'bbc.com', 'npr.org', 'pbs.org',
         'wsj.com', 'nytimes.com', 'washingtonpost.com', 'theguardian.com',
         'cnn.com', 'abcnews.go.com', 'cbsnews.com', 'nbcnews.com'
-    ]
+    })
     
     # Known unreliable or biased sources
-    UNRELIABLE_SOURCES = [
+    UNRELIABLE_SOURCES = frozenset({
         'infowars.com', 'breitbart.com', 'theonion.com', 'satirewire.com',
         'clickhole.com', 'reductress.com'  # Some satirical sites included
-    ]
+    })
     
     # Bias indicators (words that might suggest bias)
-    BIAS_INDICATORS = [
+    BIAS_INDICATORS = (
         'shocking', 'unbelievable', 'exclusive', 'breaking exclusive',
         'you won\'t believe', 'doctors hate this', 'they don\'t want you to know',
         'mainstream media', 'fake news', 'conspiracy'
-    ]
+    )
+    
+    @staticmethod
+    def _matches_source(domain: str, sources: frozenset) -> bool:
+        """Check a domain and each of its parent domains (news.bbc.com -> bbc.com) against a set"""
+        parts = domain.lower().split('.')
+        return any('.'.join(parts[i:]) in sources for i in range(len(parts) - 1))
+    
+    @classmethod
+    def is_reliable(cls, domain: str) -> bool:
+        """Return True if the domain or a parent domain is a known reliable source"""
+        return cls._matches_source(domain, cls.RELIABLE_SOURCES)
+    
+    @classmethod
+    def is_unreliable(cls, domain: str) -> bool:
+        """Return True if the domain or a parent domain is a known unreliable source"""
+        return cls._matches_source(domain, cls.UNRELIABLE_SOURCES)
@@ -4,10 +4,15 @@ Example Usage Script for Fake News Detector
 Demonstrates various ways to use the fake news detection system
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from news_analyzer import NewsAnalyzer
 from logger import FakeNewsDetectorLogger
 import json
 
+# Worker count for the concurrent examples; stays below the API clients' connection pool size
+MAX_WORKERS = 8
+
 def example_url_analysis():
     """Example: Analyze a news article from URL"""
     print("🔍 Example 1: URL Analysis")
@@ -23,24 +28,31 @@ def example_url_analysis():
         # Add more URLs as needed
     ]
     
-    for url in test_urls:
-        try:
-            print(f"\\nAnalyzing: {url}")
+    # URLs are independent and network-bound, so analyze them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for url in test_urls:
             logger.log_analysis_start("url", url)
             
             # Note: This will try to extract content from the URL
             # You might need to provide actual article URLs
-            result = analyzer.analyze_article(url=url)
-            
-            logger.log_analysis_complete(result, "url", url=url)
-            
-            print(f"  Credibility Level: {result.credibility_level}")
-            print(f"  Credibility Score: {result.overall_credibility_score:.2f}")
-            print(f"  Confidence: {result.confidence_score:.2f}")
-            print(f"  Warning Flags: {len(result.warning_flags)}")
-            
-        except Exception as e:
-            print(f"  Error analyzing {url}: {str(e)}")
+            futures[executor.submit(analyzer.analyze_article, url=url)] = url
+        
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                print(f"\\nAnalyzing: {url}")
+                result = future.result()
+                
+                logger.log_analysis_complete(result, "url", url=url)
+                
+                print(f"  Credibility Level: {result.credibility_level}")
+                print(f"  Credibility Score: {result.overall_credibility_score:.2f}")
+                print(f"  Confidence: {result.confidence_score:.2f}")
+                print(f"  Warning Flags: {len(result.warning_flags)}")
+                
+            except Exception as e:
+                print(f"  Error analyzing {url}: {str(e)}")
 
 def example_text_analysis():
     """Example: Analyze news text directly"""
@@ -132,22 +144,24 @@ def example_batch_analysis():
     
     print(f"Analyzing {len(headlines)} headlines...")
     
-    for i, headline in enumerate(headlines, 1):
-        try:
-            print(f"\\n{i}. {headline}")
-            
-            result = analyzer.analyze_article(title=headline)
-            results.append({
-                'headline': headline,
-                'credibility_level': result.credibility_level,
-                'credibility_score': result.overall_credibility_score,
-                'warning_count': len(result.warning_flags)
-            })
-            
-            print(f"   → {result.credibility_level} ({result.overall_credibility_score:.2f})")
-            
-        except Exception as e:
-            print(f"   → Error: {str(e)}")
+    batch_results = analyzer.analyze_batch(headlines, max_workers=MAX_WORKERS)
+    
+    for i, (headline, result) in enumerate(zip(headlines, batch_results), 1):
+        print(f"\\n{i}. {headline}")
+        
+        # Failed analyses come back as the exception raised for that headline
+        if isinstance(result, Exception):
+            print(f"   → Error: {str(result)}")
+            continue
+        
+        results.append({
+            'headline': headline,
+            'credibility_level': result.credibility_level,
+            'credibility_score': result.overall_credibility_score,
+            'warning_count': len(result.warning_flags)
+        })
+        
+        print(f"   → {result.credibility_level} ({result.overall_credibility_score:.2f})")
     
     # Summary statistics
     print(f"\\n--- Batch Analysis Summary ---")
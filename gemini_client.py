@@ -10,6 +10,82 @@ class GeminiAIClient:
         self.api_key = Config.GEMINI_API_KEY
         self.base_url = Config.GEMINI_API_URL
     
+    @staticmethod
+    def _article_text(title: str, content: Optional[str]) -> str:
+        """Title plus a content preview, as embedded in the article analysis prompts"""
+        text = f"Title: {title}"
+        if content:
+            # Limit content length to avoid token limits
+            content_preview = content[:2000] + "..." if len(content) > 2000 else content
+            text += f"\nContent: {content_preview}"
+        return text
+    
+    def _generate(self, prompt: str, generation_config: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """
+        Send one prompt to Gemini and parse the JSON object it replies with
+        
+        Returns:
+            {'status': 'success', 'data': parsed object, 'text': raw reply} on success,
+            {'status': 'unparsed', 'message': ..., 'text': raw reply} if the reply is not a
+            JSON object, or an error dict ('status': 'error') if the request failed
+        """
+        try:
+            request_data = {
+                "contents": [{
+                    "parts": [{
+                        "text": prompt
+                    }]
+                }],
+                "generationConfig": generation_config
+            }
+            
+            response = requests.post(
+                f"{self.base_url}?key={self.api_key}",
+                headers={'Content-Type': 'application/json'},
+                json=request_data,
+                timeout=timeout
+            )
+            
+            if response.status_code != 200:
+                return {
+                    "status": "error",
+                    "message": f"API request failed with status {response.status_code}",
+                    "error_details": response.text
+                }
+            
+            result = response.json()
+            if not result.get('candidates'):
+                return {
+                    "status": "error",
+                    "message": "No response generated by AI",
+                    "full_response": result
+                }
+            
+            generated_text = result['candidates'][0]['content']['parts'][0]['text']
+        
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Gemini API request failed: {str(e)}"
+            }
+        
+        # Clean up the response (remove any markdown formatting)
+        json_text = generated_text.strip()
+        if json_text.startswith('```json'):
+            json_text = json_text[7:]
+        if json_text.endswith('```'):
+            json_text = json_text[:-3]
+        json_text = json_text.strip()
+        
+        try:
+            data = json.loads(json_text)
+        except json.JSONDecodeError as e:
+            return {"status": "unparsed", "message": f"Failed to parse AI response: {str(e)}", "text": generated_text}
+        if not isinstance(data, dict):
+            return {"status": "unparsed", "message": "AI response is not a JSON object", "text": generated_text}
+        
+        return {"status": "success", "data": data, "text": generated_text}
+    
     def analyze_news_credibility(self, title: str, content: str = None) -> Dict[str, Any]:
         """
         Use Gemini AI to analyze news credibility with advanced reasoning
@@ -25,11 +101,7 @@ class GeminiAIClient:
             return {"status": "error", "message": "Gemini API key not configured"}
         
         # Construct the analysis prompt
-        text_to_analyze = f"Title: {title}"
-        if content:
-            # Limit content length to avoid token limits
-            content_preview = content[:2000] + "..." if len(content) > 2000 else content
-            text_to_analyze += f"\\nContent: {content_preview}"
+        text_to_analyze = self._article_text(title, content)
         
         prompt = f"""
 As an expert fact-checker and media analyst, please analyze this news article for credibility and potential misinformation. Consider the following factors:
@@ -66,79 +138,126 @@ Please provide your analysis in the following JSON format:
 Respond only with the JSON, no additional text.
         """
         
-        try:
-            # Prepare request data
-            request_data = {
-                "contents": [{
-                    "parts": [{
-                        "text": prompt
-                    }]
-                }],
-                "generationConfig": {
-                    "temperature": 0.1,  # Low temperature for consistent, factual responses
-                    "topK": 1,
-                    "topP": 0.8,
-                    "maxOutputTokens": 1000,
-                }
-            }
-            
-            # Make API request
-            response = requests.post(
-                f"{self.base_url}?key={self.api_key}",
-                headers={
-                    'Content-Type': 'application/json',
-                },
-                json=request_data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                # Extract the generated text
-                if 'candidates' in result and result['candidates']:
-                    generated_text = result['candidates'][0]['content']['parts'][0]['text']
-                    
-                    # Try to parse the JSON response
-                    try:
-                        # Clean up the response (remove any markdown formatting)
-                        json_text = generated_text.strip()
-                        if json_text.startswith('```json'):
-                            json_text = json_text[7:]
-                        if json_text.endswith('```'):
-                            json_text = json_text[:-3]
-                        json_text = json_text.strip()
-                        
-                        ai_analysis = json.loads(json_text)
-                        ai_analysis['status'] = 'success'
-                        ai_analysis['source'] = 'gemini_ai'
-                        
-                        return ai_analysis
-                        
-                    except json.JSONDecodeError as e:
-                        return {
-                            "status": "error", 
-                            "message": f"Failed to parse AI response: {str(e)}",
-                            "raw_response": generated_text
-                        }
-                else:
-                    return {
-                        "status": "error", 
-                        "message": "No response generated by AI",
-                        "full_response": result
-                    }
-            else:
-                return {
-                    "status": "error", 
-                    "message": f"API request failed with status {response.status_code}",
-                    "error_details": response.text
-                }
-                
-        except Exception as e:
+        reply = self._generate(prompt, {
+            "temperature": 0.1,  # Low temperature for consistent, factual responses
+            "topK": 1,
+            "topP": 0.8,
+            "maxOutputTokens": 1000,
+        }, timeout=30)
+        
+        if reply['status'] == 'unparsed':
+            return {"status": "error", "message": reply['message'], "raw_response": reply['text']}
+        if reply['status'] != 'success':
+            return reply
+        
+        ai_analysis = reply['data']
+        ai_analysis['status'] = 'success'
+        ai_analysis['source'] = 'gemini_ai'
+        return ai_analysis
+    
+    def analyze_combined(self, title: str, content: str = None) -> Dict[str, Any]:
+        """
+        Credibility and bias/manipulation analysis in a single Gemini request
+        
+        Args:
+            title: News article title/headline
+            content: News article content (optional)
+        
+        Returns:
+            Dict shaped like analyze_news_credibility(), with the bias analysis
+            (as from detect_bias_and_manipulation()) under 'bias_analysis'
+        """
+        if not self.api_key:
+            return {"status": "error", "message": "Gemini API key not configured"}
+        
+        # Construct the analysis prompt
+        text_to_analyze = self._article_text(title, content)
+        
+        prompt = f"""
+As an expert fact-checker and media analyst, please analyze this news article for credibility and potential misinformation, and for bias, manipulation techniques and propaganda. Consider the following factors:
+
+1. **Source Credibility**: Is this from a reliable news source?
+2. **Content Quality**: Are there specific, verifiable facts?
+3. **Language Analysis**: Look for emotional manipulation, loaded language, clickbait, or bias
+4. **Logical Consistency**: Does the information make logical sense? Are there logical fallacies or false dichotomies?
+5. **Red Flags**: Identify any suspicious patterns, cherry-picked facts or claims
+6. **Appeal to Emotions vs. Facts**: Does the text rely on emotion rather than evidence?
+
+News Article:
+{text_to_analyze}
+
+Please provide your analysis in the following JSON format:
+{{
+    "credibility": {{
+        "credibility_score": [0.0-1.0],
+        "credibility_level": "[Very Low|Low|Medium|High|Very High]",
+        "key_findings": [
+            "finding 1",
+            "finding 2",
+            "finding 3"
+        ],
+        "red_flags": [
+            "red flag 1 (if any)",
+            "red flag 2 (if any)"
+        ],
+        "verification_suggestions": [
+            "suggestion 1",
+            "suggestion 2"
+        ],
+        "reasoning": "Brief explanation of your assessment"
+    }},
+    "bias_analysis": {{
+        "bias_level": "[Low|Medium|High]",
+        "bias_score": [0.0-1.0],
+        "manipulation_techniques": [
+            "technique 1",
+            "technique 2"
+        ],
+        "emotional_language": [
+            "example 1",
+            "example 2"
+        ],
+        "objectivity_score": [0.0-1.0],
+        "recommendations": [
+            "recommendation 1",
+            "recommendation 2"
+        ]
+    }}
+}}
+
+Respond only with the JSON, no additional text.
+        """
+        
+        reply = self._generate(prompt, {
+            "temperature": 0.1,
+            "topK": 1,
+            "topP": 0.8,
+            "maxOutputTokens": 1800,  # Room for both analyses
+        }, timeout=30)
+        
+        if reply['status'] == 'unparsed':
+            return {"status": "error", "message": reply['message'], "raw_response": reply['text']}
+        if reply['status'] != 'success':
+            return reply
+        
+        credibility = reply['data'].get('credibility')
+        if not isinstance(credibility, dict):
             return {
-                "status": "error", 
-                "message": f"Gemini API request failed: {str(e)}"
+                "status": "error",
+                "message": "AI response has no credibility analysis",
+                "raw_response": reply['text']
             }
+        
+        ai_analysis = dict(credibility)
+        ai_analysis['status'] = 'success'
+        ai_analysis['source'] = 'gemini_ai'
+        
+        bias_analysis = reply['data'].get('bias_analysis')
+        if isinstance(bias_analysis, dict):
+            bias_analysis['status'] = 'success'
+            ai_analysis['bias_analysis'] = bias_analysis
+        
+        return ai_analysis
     
     def summarize_article(self, title: str, content: str) -> Dict[str, Any]:
         """
@@ -178,54 +297,23 @@ Provide your response in JSON format:
 Respond only with the JSON, no additional text.
         """
         
-        try:
-            request_data = {
-                "contents": [{
-                    "parts": [{
-                        "text": prompt
-                    }]
-                }],
-                "generationConfig": {
-                    "temperature": 0.2,
-                    "maxOutputTokens": 500,
-                }
+        reply = self._generate(prompt, {
+            "temperature": 0.2,
+            "maxOutputTokens": 500,
+        }, timeout=20)
+        
+        if reply['status'] == 'unparsed':
+            return {
+                "status": "partial_success",
+                "summary": reply['text'],
+                "message": "Could not parse structured response"
             }
-            
-            response = requests.post(
-                f"{self.base_url}?key={self.api_key}",
-                headers={'Content-Type': 'application/json'},
-                json=request_data,
-                timeout=20
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and result['candidates']:
-                    generated_text = result['candidates'][0]['content']['parts'][0]['text']
-                    
-                    # Clean and parse JSON
-                    json_text = generated_text.strip()
-                    if json_text.startswith('```json'):
-                        json_text = json_text[7:]
-                    if json_text.endswith('```'):
-                        json_text = json_text[:-3]
-                    json_text = json_text.strip()
-                    
-                    try:
-                        summary_data = json.loads(json_text)
-                        summary_data['status'] = 'success'
-                        return summary_data
-                    except json.JSONDecodeError:
-                        return {
-                            "status": "partial_success",
-                            "summary": generated_text,
-                            "message": "Could not parse structured response"
-                        }
-            
-            return {"status": "error", "message": f"API request failed: {response.status_code}"}
-            
-        except Exception as e:
-            return {"status": "error", "message": f"Summary request failed: {str(e)}"}
+        if reply['status'] != 'success':
+            return reply
+        
+        summary_data = reply['data']
+        summary_data['status'] = 'success'
+        return summary_data
     
     def detect_bias_and_manipulation(self, text: str) -> Dict[str, Any]:
         """
@@ -275,51 +363,20 @@ Respond in JSON format:
 Respond only with the JSON.
         """
         
-        try:
-            request_data = {
-                "contents": [{
-                    "parts": [{
-                        "text": prompt
-                    }]
-                }],
-                "generationConfig": {
-                    "temperature": 0.1,
-                    "maxOutputTokens": 800,
-                }
+        reply = self._generate(prompt, {
+            "temperature": 0.1,
+            "maxOutputTokens": 800,
+        }, timeout=25)
+        
+        if reply['status'] == 'unparsed':
+            return {
+                "status": "error",
+                "message": "Could not parse AI bias analysis",
+                "raw_response": reply['text']
             }
-            
-            response = requests.post(
-                f"{self.base_url}?key={self.api_key}",
-                headers={'Content-Type': 'application/json'},
-                json=request_data,
-                timeout=25
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and result['candidates']:
-                    generated_text = result['candidates'][0]['content']['parts'][0]['text']
-                    
-                    # Parse JSON response
-                    json_text = generated_text.strip()
-                    if json_text.startswith('```json'):
-                        json_text = json_text[7:]
-                    if json_text.endswith('```'):
-                        json_text = json_text[:-3]
-                    json_text = json_text.strip()
-                    
-                    try:
-                        bias_analysis = json.loads(json_text)
-                        bias_analysis['status'] = 'success'
-                        return bias_analysis
-                    except json.JSONDecodeError:
-                        return {
-                            "status": "error",
-                            "message": "Could not parse AI bias analysis",
-                            "raw_response": generated_text
-                        }
-            
-            return {"status": "error", "message": f"Bias analysis failed: {response.status_code}"}
-            
-        except Exception as e:
-            return {"status": "error", "message": f"Bias detection failed: {str(e)}"}
+        if reply['status'] != 'success':
+            return reply
+        
+        bias_analysis = reply['data']
+        bias_analysis['status'] = 'success'
+        return bias_analysis
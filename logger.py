@@ -1,18 +1,129 @@
+import atexit
 import logging
+import logging.handlers
 import json
 import csv
+import gzip
+from collections import Counter
+import queue
+import re
+import threading
+import zlib
+import orjson
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import os
 
-from news_analyzer import NewsAnalysisResult
+# Only needed for annotations; importing the analyzer would pull in NLTK, TextBlob and the API clients
+if TYPE_CHECKING:
+    from news_analyzer import NewsAnalysisResult
+
+# orjson flags for analysis log lines: newline-terminated bytes, numpy scalars and non-str keys allowed
+_JSONL_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Raw append-only descriptor for the JSONL log: the kernel positions every write at end of
+# file, and the descriptor is not inherited by child processes
+_APPEND_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_APPEND
+                 | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+
+# Shared by the file and console handlers
+_FORMATTER = logging.Formatter(
+    '{asctime} - {name} - {levelname} - {message}', style='{', datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Characters that force a CSV field to be quoted under the default (excel) dialect
+_CSV_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+def _csv_field(value: Any) -> str:
+    """Format one CSV field exactly as csv.writer's default dialect would"""
+    if value is None:
+        return ''
+    text = value if isinstance(value, str) else str(value)
+    if _CSV_NEEDS_QUOTING.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+class _DailyStats:
+    """Running aggregates behind the daily report, updated one analysis record at a time"""
+    
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.total = data.get('total', 0)
+        self.type_counts = Counter(data.get('type_counts', {}))
+        self.level_counts = Counter(data.get('level_counts', {}))
+        self.domain_counts = Counter(data.get('domain_counts', {}))
+        self.indicator_counts = Counter(data.get('indicator_counts', {}))
+        self.total_warnings = data.get('total_warnings', 0)
+        self.analyses_with_warnings = data.get('analyses_with_warnings', 0)
+        self.credibility_sum = data.get('credibility_sum', 0)
+        self.confidence_sum = data.get('confidence_sum', 0)
+        self.high_credibility = data.get('high_credibility', 0)
+        self.low_credibility = data.get('low_credibility', 0)
+    
+    def add(self, analysis: Dict[str, Any]):
+        """Fold one analysis log record into the aggregates"""
+        results = analysis.get('results', {})
+        self.total += 1
+        self.type_counts[analysis.get('analysis_type', 'unknown')] += 1
+        self.level_counts[results.get('credibility_level', 'unknown')] += 1
+        
+        warning_count = len(results.get('warning_flags', []))
+        self.total_warnings += warning_count
+        self.analyses_with_warnings += warning_count > 0
+        
+        credibility_score = results.get('overall_credibility_score', 0)
+        self.credibility_sum += credibility_score
+        self.confidence_sum += results.get('confidence_score', 0)
+        self.high_credibility += credibility_score >= 0.8
+        self.low_credibility += credibility_score <= 0.3
+        
+        source_cred = results.get('source_credibility')
+        if source_cred and source_cred.get('domain'):
+            self.domain_counts[source_cred['domain']] += 1
+        
+        self.indicator_counts.update(results.get('bias_indicators', []))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for the sidecar file"""
+        return dict(vars(self))
+    
+    def report(self, date: str) -> Dict[str, Any]:
+        """Build the daily report from the aggregates"""
+        total = self.total
+        return {
+            "date": date,
+            "total_analyses": total,
+            "analysis_types": dict(self.type_counts),
+            "credibility_distribution": dict(self.level_counts),
+            "warning_statistics": {
+                "total_warnings": self.total_warnings,
+                "avg_warnings_per_analysis": self.total_warnings / total,
+                "analyses_with_warnings": self.analyses_with_warnings
+            },
+            "performance_metrics": {
+                "avg_credibility_score": self.credibility_sum / total,
+                "avg_confidence_score": self.confidence_sum / total,
+                "high_credibility_count": self.high_credibility,
+                "low_credibility_count": self.low_credibility
+            },
+            # Top domains analyzed and most common bias indicators (heap-based top 10, no full sort)
+            "top_domains": dict(self.domain_counts.most_common(10)),
+            "common_bias_indicators": dict(self.indicator_counts.most_common(10))
+        }
 
 class FakeNewsDetectorLogger:
     """Comprehensive logging and reporting system for the fake news detector"""
     
-    def __init__(self, log_dir: str = "logs"):
+    # Default number of JSONL/CSV records buffered before they are flushed to disk; each
+    # flush hands the whole batch to the OS in a single write() per file
+    FLUSH_EVERY = 64
+    # Analyses that may be waiting on the writer before log_analysis_complete() blocks
+    QUEUE_SIZE = 1024
+    
+    def __init__(self, log_dir: str = "logs", flush_every: int = FLUSH_EVERY):
         self.log_dir = Path(log_dir)
+        self.flush_every = max(int(flush_every), 1)
         self.log_dir.mkdir(exist_ok=True)
         
         # Setup main logger
@@ -24,7 +135,8 @@ class FakeNewsDetectorLogger:
             self.logger.removeHandler(handler)
         
         # File handler for general logs
-        log_file = self.log_dir / f"fake_news_detector_{datetime.now().strftime('%Y%m%d')}.log"
+        today = datetime.now().strftime('%Y%m%d')
+        log_file = self.log_dir / f"fake_news_detector_{today}.log"
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.INFO)
         
@@ -33,21 +145,48 @@ class FakeNewsDetectorLogger:
         console_handler.setLevel(logging.INFO)
         
         # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        formatter = _FORMATTER
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-        
-        # Analysis results log file
-        self.analysis_log_file = self.log_dir / f"analysis_results_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        # Callers only enqueue records; a listener thread does the formatting and the I/O
+        self._log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        
+        # Today's report aggregates, carried on from the sidecar (or a rescan) if the day has
+        # already been logged to, then kept current by the writer thread
+        self._today = today
+        self._covered_sizes = self._log_sizes(today)
+        self._stats = self._load_stats(today) or self._scan_stats(today)
+        # (start, end) offsets of members this logger appended since the last sync; their
+        # records are already in the aggregates
+        self._own_members = []
+        
+        # Analysis results log file, kept open for appending. Records are batched in memory and
+        # each flush appends the batch as one complete gzip member (fastest level) in a single
+        # write, so loggers sharing the day's file never interleave inside a member.
+        self.analysis_log_file = self.log_dir / f"analysis_results_{today}.jsonl.gz"
+        self._jsonl_fd = os.open(self.analysis_log_file, _APPEND_FLAGS, 0o644)
         
         # CSV report file
-        self.csv_report_file = self.log_dir / f"analysis_summary_{datetime.now().strftime('%Y%m%d')}.csv"
+        self.csv_report_file = self.log_dir / f"analysis_summary_{today}.csv"
         self._init_csv_file()
+        
+        # One long-lived, buffered handle instead of reopening the CSV for every row
+        self._csv_fh = open(self.csv_report_file, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        
+        # JSONL/CSV records are built and written by a background thread that owns both handles;
+        # the bounded queue applies backpressure if the disk falls behind
+        self._write_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._write_records, name='fake-news-log-writer', daemon=True)
+        self._writer.start()
+        self._close_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
     
     def _init_csv_file(self):
         """Initialize CSV file with headers if it doesn't exist"""
@@ -67,33 +206,39 @@ class FakeNewsDetectorLogger:
         """Log the start of an analysis"""
         self.logger.info(f"Starting {analysis_type} analysis for: {target[:100]}")
     
-    def log_analysis_complete(self, result: NewsAnalysisResult, analysis_type: str, 
+    def log_analysis_complete(self, result: 'NewsAnalysisResult', analysis_type: str, 
                             url: str = None, title: str = None, content_length: int = 0):
         """Log completed analysis with full results"""
         
-        # Log to main logger
+        # Log to main logger (%-style arguments are only formatted if the record is emitted)
         self.logger.info(
-            f"Analysis completed - Credibility: {result.credibility_level} "
-            f"({result.overall_credibility_score:.2f}) - Confidence: {result.confidence_score:.2f}"
+            "Analysis completed - Credibility: %s (%.2f) - Confidence: %.2f",
+            result.credibility_level, result.overall_credibility_score, result.confidence_score
         )
         
-        # Log detailed results to JSONL file
-        self._log_detailed_analysis(result, analysis_type, url, title, content_length)
+        # One second-resolution timestamp shared by the JSONL and CSV records; taken here so it
+        # reflects when the analysis finished, not when the writer got to it
+        timestamp = datetime.now().isoformat(timespec='seconds')
         
-        # Log summary to CSV
-        self._log_csv_summary(result, analysis_type, url, title)
+        # JSONL and CSV records are built and written on the writer thread
+        self._write_queue.put(('analysis', (result, analysis_type, url, title, content_length, timestamp)))
         
-        # Log warnings if any
+        # Log warnings if any, first 3 in a single record
         if result.warning_flags:
-            self.logger.warning(f"Analysis produced {len(result.warning_flags)} warning flags")
-            for flag in result.warning_flags[:3]:  # Log first 3 warnings
-                self.logger.warning(f"  - {flag}")
+            self.logger.warning(
+                "Analysis produced %d warning flags: %s",
+                len(result.warning_flags), " | ".join(result.warning_flags[:3])
+            )
     
-    def _log_detailed_analysis(self, result: NewsAnalysisResult, analysis_type: str,
-                             url: str, title: str, content_length: int):
-        """Log detailed analysis results to JSONL file"""
+    def _log_detailed_analysis(self, result: 'NewsAnalysisResult', analysis_type: str,
+                             url: str, title: str, content_length: int, timestamp: str):
+        """Build the detailed JSONL record, returning the encoded line and the entry"""
+        # Bind each section once; a missing section reads as empty
+        content = result.content_analysis or {}
+        cross_ref = result.cross_reference_results or {}
+        
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'analysis_type': analysis_type,
             'url': url,
             'title': title[:200] if title else None,  # Truncate long titles
@@ -105,15 +250,15 @@ class FakeNewsDetectorLogger:
                 'sentiment_analysis': result.sentiment_analysis,
                 'source_credibility': result.source_credibility,
                 'content_analysis': {
-                    'word_count': result.content_analysis.get('word_count') if result.content_analysis else None,
-                    'sentence_count': result.content_analysis.get('sentence_count') if result.content_analysis else None,
-                    'suspicious_patterns_count': len(result.content_analysis.get('suspicious_patterns', [])) if result.content_analysis else 0,
-                    'keywords_count': len(result.content_analysis.get('keywords', [])) if result.content_analysis else 0
+                    'word_count': content.get('word_count'),
+                    'sentence_count': content.get('sentence_count'),
+                    'suspicious_patterns_count': len(content.get('suspicious_patterns', [])),
+                    'keywords_count': len(content.get('keywords', []))
                 },
                 'cross_reference_results': {
-                    'consensus_score': result.cross_reference_results.get('consensus_score') if result.cross_reference_results else None,
-                    'source_diversity': result.cross_reference_results.get('source_diversity') if result.cross_reference_results else None,
-                    'similar_articles_count': len(result.cross_reference_results.get('similar_articles', [])) if result.cross_reference_results else 0
+                    'consensus_score': cross_ref.get('consensus_score'),
+                    'source_diversity': cross_ref.get('source_diversity'),
+                    'similar_articles_count': len(cross_ref.get('similar_articles', []))
                 },
                 'bias_indicators_count': len(result.bias_indicators),
                 'warning_flags_count': len(result.warning_flags),
@@ -124,33 +269,96 @@ class FakeNewsDetectorLogger:
             }
         }
         
-        with open(self.analysis_log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+        return orjson.dumps(log_entry, option=_JSONL_OPTIONS), log_entry
     
-    def _log_csv_summary(self, result: NewsAnalysisResult, analysis_type: str,
-                        url: str, title: str):
-        """Log summary to CSV file"""
+    def _log_csv_summary(self, result: 'NewsAnalysisResult', analysis_type: str,
+                        url: str, title: str, timestamp: str):
+        """Build the CSV summary line"""
+        source = result.source_credibility or {}
+        sentiment = result.sentiment_analysis or {}
+        content = result.content_analysis or {}
+        cross_ref = result.cross_reference_results or {}
+        
         row = [
-            datetime.now().isoformat(),
+            timestamp,
             analysis_type,
             url or '',
             (title[:100] + '...') if title and len(title) > 100 else (title or ''),
             result.overall_credibility_score,
             result.credibility_level,
             result.confidence_score,
-            result.source_credibility.get('domain', '') if result.source_credibility else '',
-            result.source_credibility.get('bias_check', {}).get('credibility', '') if result.source_credibility else '',
+            source.get('domain', ''),
+            source.get('bias_check', {}).get('credibility', ''),
             len(result.warning_flags),
             len(result.bias_indicators),
-            result.sentiment_analysis.get('sentiment', '') if result.sentiment_analysis else '',
-            result.content_analysis.get('word_count', '') if result.content_analysis else '',
-            result.cross_reference_results.get('consensus_score', '') if result.cross_reference_results else '',
-            result.cross_reference_results.get('source_diversity', '') if result.cross_reference_results else ''
+            sentiment.get('sentiment', ''),
+            content.get('word_count', ''),
+            cross_ref.get('consensus_score', ''),
+            cross_ref.get('source_diversity', '')
         ]
         
-        with open(self.csv_report_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
+        # Most fields (scores, levels, domains) need no quoting, so build the line directly
+        return ','.join(map(_csv_field, row)) + '\r\n'
+    
+    def _write_records(self):
+        """Background writer: build queued analyses into JSONL/CSV records, writing them in batches"""
+        jsonl_batch = []
+        csv_batch = []
+        while True:
+            kind, item = self._write_queue.get()
+            try:
+                if kind == 'analysis':
+                    result, analysis_type, url, title, content_length, timestamp = item
+                    payload, log_entry = self._log_detailed_analysis(
+                        result, analysis_type, url, title, content_length, timestamp
+                    )
+                    jsonl_batch.append(payload)
+                    self._stats.add(log_entry)
+                    csv_batch.append(self._log_csv_summary(result, analysis_type, url, title, timestamp))
+                
+                if jsonl_batch and (kind in ('flush', 'stop') or len(jsonl_batch) >= self.flush_every):
+                    member = gzip.compress(b''.join(jsonl_batch), compresslevel=1)
+                    end = self._append(member)
+                    self._own_members.append((end - len(member), end))
+                    jsonl_batch.clear()
+                    self._sync_stats()
+                if csv_batch and (kind in ('flush', 'stop') or len(csv_batch) >= self.flush_every):
+                    self._csv_fh.write(''.join(csv_batch))
+                    self._csv_fh.flush()
+                    csv_batch.clear()
+            except Exception as e:
+                self.logger.error(f"Error writing analysis log: {str(e)}")
+            
+            if kind in ('flush', 'stop'):
+                item.set()  # Control messages carry an Event the caller waits on
+                if kind == 'stop':
+                    return
+    
+    def flush(self):
+        """Write all queued and buffered JSONL and CSV records to disk"""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._write_queue.put(('flush', done))
+        done.wait()
+    
+    def close(self):
+        """Drain the writer, close the log files and stop the log listener"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        
+        done = threading.Event()
+        self._write_queue.put(('stop', done))
+        done.wait()
+        self._writer.join()
+        os.close(self._jsonl_fd)
+        self._csv_fh.close()
+        
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            handler.close()
     
     def log_error(self, error: Exception, context: str = ""):
         """Log errors with context"""
@@ -164,98 +372,144 @@ class FakeNewsDetectorLogger:
         """Log info messages"""
         self.logger.info(message)
     
+    def _analysis_log_paths(self, date: str) -> List[Path]:
+        """Existing analysis logs for a day: a plain .jsonl from older versions, then the .jsonl.gz"""
+        base = self.log_dir / f"analysis_results_{date}.jsonl"
+        return [path for path in (base, base.with_name(base.name + '.gz')) if path.exists()]
+    
+    @staticmethod
+    def _iter_analysis_records(paths: List[Path]):
+        """Yield parsed analysis records from the given logs, skipping malformed lines"""
+        for path in paths:
+            opener = gzip.open if path.suffix == '.gz' else open
+            with opener(path, 'rb') as f:
+                try:
+                    for line in f:
+                        try:
+                            yield orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
+                except EOFError:
+                    # A member cut short (e.g. by a crash mid-write) ends the readable data
+                    pass
+    
+    def _stats_path(self, date: str) -> Path:
+        """Sidecar file holding the running report aggregates for a day"""
+        return self.log_dir / f"stats_{date}.json"
+    
+    def _log_sizes(self, date: str) -> Dict[str, int]:
+        """Sizes of a day's analysis logs, which tell whether a sidecar still matches them"""
+        return {path.name: path.stat().st_size for path in self._analysis_log_paths(date)}
+    
+    def _save_stats(self):
+        """Write today's aggregates to the sidecar, tagged with the log sizes they cover"""
+        data = self._stats.to_dict()
+        data['log_sizes'] = self._covered_sizes
+        path = self._stats_path(self._today)
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(orjson.dumps(data))
+        os.replace(tmp_path, path)
+    
+    def _append(self, data: bytes) -> int:
+        """Append bytes to the JSONL log; a regular-file O_APPEND write lands as one piece.
+        Returns the file offset just past the appended bytes"""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._jsonl_fd, view):]
+        return os.lseek(self._jsonl_fd, 0, os.SEEK_CUR)
+    
+    def _add_members(self, f, start: int, stop: int) -> int:
+        """Add the records in the complete gzip members between two offsets of the open log to
+        today's aggregates; returns how many bytes those members span"""
+        f.seek(start)
+        data = f.read(stop - start)
+        consumed = 0
+        while consumed < len(data):
+            decoder = zlib.decompressobj(wbits=31)
+            try:
+                chunk = decoder.decompress(data[consumed:])
+            except zlib.error:
+                return len(data)  # Corrupt bytes - readers stop here too, so do not recount them
+            if not decoder.eof:
+                break  # Another logger's member that is still being written
+            consumed = len(data) - len(decoder.unused_data)
+            for line in chunk.splitlines():
+                try:
+                    self._stats.add(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+        return consumed
+    
+    def _sync_stats(self):
+        """After appending, fold in members other loggers appended and save the aggregates if
+        they cover the whole log"""
+        name = self.analysis_log_file.name
+        sizes = self._log_sizes(self._today)
+        covered = self._covered_sizes.get(name, 0)
+        size = sizes.get(name, 0)
+        others = {log: log_size for log, log_size in sizes.items() if log != name}
+        covered_others = {log: log_size for log, log_size in self._covered_sizes.items() if log != name}
+        
+        if size < covered or others != covered_others:
+            # A log shrank or was replaced; recount from the logs
+            self._stats = self._scan_stats(self._today)
+            self._own_members.clear()
+            if self._log_sizes(self._today) != sizes:
+                return  # Still being appended to - retry on the next flush
+            self._covered_sizes = sizes
+            self._save_stats()
+            return
+        
+        # Only the bytes since the last sync that this logger did not write need reading
+        offset = covered
+        with open(self.analysis_log_file, 'rb') as f:
+            for start, end in self._own_members:
+                if start > offset:
+                    self._add_members(f, offset, start)
+                offset = max(offset, end)
+            if size > offset:
+                offset += self._add_members(f, offset, size)
+        self._own_members.clear()
+        
+        self._covered_sizes = {**sizes, name: offset}
+        if offset == size:
+            self._save_stats()
+    
+    def _load_stats(self, date: str) -> Optional[_DailyStats]:
+        """Read a day's sidecar, or None if it is missing or other writers have since appended"""
+        try:
+            data = orjson.loads(self._stats_path(date).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if data.pop('log_sizes', None) != self._log_sizes(date):
+            return None
+        return _DailyStats(data)
+    
+    def _scan_stats(self, date: str) -> _DailyStats:
+        """Rebuild a day's aggregates by reading its analysis logs"""
+        stats = _DailyStats()
+        for analysis in self._iter_analysis_records(self._analysis_log_paths(date)):
+            stats.add(analysis)
+        return stats
+    
     def generate_daily_report(self, date: Optional[str] = None) -> Dict[str, Any]:
         """Generate a comprehensive daily analysis report"""
         if date is None:
             date = datetime.now().strftime('%Y%m%d')
         
-        analysis_file = self.log_dir / f"analysis_results_{date}.jsonl"
+        self.flush()  # Include records still sitting in the write buffer
+        analysis_files = self._analysis_log_paths(date)
         
-        if not analysis_file.exists():
+        if not analysis_files:
             return {"error": f"No analysis data found for {date}"}
         
-        analyses = []
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                try:
-                    analyses.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        # The sidecar makes this O(1); rescan the logs only if it is missing or stale
+        stats = self._load_stats(date) or self._scan_stats(date)
         
-        if not analyses:
+        if not stats.total:
             return {"error": f"No valid analysis data found for {date}"}
         
-        # Generate statistics
-        report = {
-            "date": date,
-            "total_analyses": len(analyses),
-            "analysis_types": {},
-            "credibility_distribution": {},
-            "warning_statistics": {},
-            "performance_metrics": {},
-            "top_domains": {},
-            "common_bias_indicators": {}
-        }
-        
-        # Count analysis types
-        for analysis in analyses:
-            analysis_type = analysis.get('analysis_type', 'unknown')
-            report["analysis_types"][analysis_type] = report["analysis_types"].get(analysis_type, 0) + 1
-        
-        # Credibility distribution
-        for analysis in analyses:
-            level = analysis.get('results', {}).get('credibility_level', 'unknown')
-            report["credibility_distribution"][level] = report["credibility_distribution"].get(level, 0) + 1
-        
-        # Warning statistics
-        warning_counts = [len(analysis.get('results', {}).get('warning_flags', [])) for analysis in analyses]
-        report["warning_statistics"] = {
-            "total_warnings": sum(warning_counts),
-            "avg_warnings_per_analysis": sum(warning_counts) / len(warning_counts) if warning_counts else 0,
-            "analyses_with_warnings": sum(1 for count in warning_counts if count > 0)
-        }
-        
-        # Performance metrics
-        credibility_scores = [
-            analysis.get('results', {}).get('overall_credibility_score', 0)
-            for analysis in analyses
-        ]
-        confidence_scores = [
-            analysis.get('results', {}).get('confidence_score', 0)
-            for analysis in analyses
-        ]
-        
-        report["performance_metrics"] = {
-            "avg_credibility_score": sum(credibility_scores) / len(credibility_scores) if credibility_scores else 0,
-            "avg_confidence_score": sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0,
-            "high_credibility_count": sum(1 for score in credibility_scores if score >= 0.8),
-            "low_credibility_count": sum(1 for score in credibility_scores if score <= 0.3)
-        }
-        
-        # Top domains analyzed
-        domains = []
-        for analysis in analyses:
-            source_cred = analysis.get('results', {}).get('source_credibility')
-            if source_cred and source_cred.get('domain'):
-                domains.append(source_cred['domain'])
-        
-        domain_counts = {}
-        for domain in domains:
-            domain_counts[domain] = domain_counts.get(domain, 0) + 1
-        
-        report["top_domains"] = dict(sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-        
-        # Common bias indicators
-        all_indicators = []
-        for analysis in analyses:
-            indicators = analysis.get('results', {}).get('bias_indicators', [])
-            all_indicators.extend(indicators)
-        
-        indicator_counts = {}
-        for indicator in all_indicators:
-            indicator_counts[indicator] = indicator_counts.get(indicator, 0) + 1
-        
-        report["common_bias_indicators"] = dict(sorted(indicator_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        report = stats.report(date)
         
         # Save report
         report_file = self.log_dir / f"daily_report_{date}.json"
@@ -274,6 +528,7 @@ class FakeNewsDetectorLogger:
         if format.lower() == "json":
             return self._export_json(date_range)
         elif format.lower() == "csv":
+            self.flush()
             return str(self.csv_report_file)
         else:
             raise ValueError(f"Unsupported export format: {format}")
@@ -285,18 +540,18 @@ class FakeNewsDetectorLogger:
         # For simplicity, export today's data
         # You could extend this to handle date ranges
         today = datetime.now().strftime('%Y%m%d')
-        analysis_file = self.log_dir / f"analysis_results_{today}.jsonl"
-        
-        if analysis_file.exists():
-            analyses = []
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        analyses.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-            
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(analyses, f, indent=2, ensure_ascii=False)
+        self.flush()  # Include records still sitting in the write buffer
+        analysis_files = self._analysis_log_paths(today)
+        
+        if analysis_files:
+            # Stream record by record into an indented JSON array rather than building a list
+            with open(export_file, 'wb') as out:
+                out.write(b'[')
+                first = True
+                for analysis in self._iter_analysis_records(analysis_files):
+                    out.write(b'\n  ' if first else b',\n  ')
+                    out.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+                    first = False
+                out.write(b']' if first else b'\n]')
         
         return str(export_file)
@@ -39,6 +39,8 @@ def run_examples():
 
 def show_info():
     """Show system information and setup status"""
+    from importlib.metadata import distribution, PackageNotFoundError
+    
     print("🛡️  Fake News Detector - System Information")
     print("=" * 60)
     
@@ -52,20 +54,12 @@ def show_info():
         'newspaper3k', 'python-dotenv', 'flask', 'pandas', 'numpy'
     ]
     
+    # Look up installed distributions by name instead of importing (and initializing) each package
     for dep in dependencies:
         try:
-            # Special cases for imports
-            if dep == 'beautifulsoup4':
-                import_name = 'bs4'
-            elif dep == 'python-dotenv':
-                import_name = 'dotenv'
-            elif dep == 'newspaper3k':
-                import_name = 'newspaper'
-            else:
-                import_name = dep.replace('-', '_')
-            __import__(import_name)
+            distribution(dep)
             print(f"  ✅ {dep}")
-        except ImportError:
+        except PackageNotFoundError:
             print(f"  ❌ {dep} - Run: pip install {dep}")
     
     # Check NLTK data
@@ -1,21 +1,133 @@
 import re
+import copy
+import bisect
+import functools
+import hashlib
 import urllib.parse
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple, Union
+from dataclasses import dataclass, fields, replace
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from urllib.parse import urlparse
 import math
 
+from cachetools import TTLCache
 from api_clients import (
     NewsAPIClient, GoogleFactCheckClient, FreeTextAnalysisClient,
-    MediaBiasFactCheckClient, CrossReferenceClient
+    MediaBiasFactCheckClient, CrossReferenceClient, parse_url
 )
 from gemini_client import GeminiAIClient
 from config import Config
 
+# Pool for the independent remote lookups of one analysis (cross-reference, fact check, Gemini).
+# Kept apart from api_clients' pool because cross-referencing itself waits on that one.
+_REMOTE_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='news-analyzer')
+
+# Complete analyses keyed by a hash of their inputs, so resubmitting an article is free
+_result_cache = TTLCache(maxsize=2048, ttl=Config.RESULT_CACHE_TTL)
+_result_lock = Lock()
+
+def _union_regex(patterns: Tuple[str, ...]) -> 're.Pattern':
+    """Compile patterns into one alternation; group g<i> records which pattern matched.
+    
+    The alternation sits in a lookahead, so every position is tried and a long match
+    (e.g. 'all .* are') cannot hide a shorter pattern inside it.
+    """
+    return re.compile('(?=(?:' + '|'.join(f'(?P<g{i}>{p})' for i, p in enumerate(patterns)) + '))')
+
+def _matched_indexes(regex: 're.Pattern', text: str) -> List[int]:
+    """Indexes of the patterns a _union_regex finds anywhere in text, in pattern order"""
+    return sorted({int(match.lastgroup[1:]) for match in regex.finditer(text)})
+
+# Content heuristics, matched against lowercased text
+_CLICKBAIT_PATTERNS = (
+    r'you won\'t believe',
+    r'shocking',
+    r'this will blow your mind',
+    r'doctors hate this',
+    r'number \d+ will shock you'
+)
+_EMOTIONAL_WORDS = (
+    'outrageous', 'disgraceful', 'shocking', 'unbelievable',
+    'devastating', 'alarming', 'terrifying', 'incredible'
+)
+_ABSOLUTE_PATTERNS = (
+    r'always', r'never', r'all .* are', r'every .* is',
+    r'completely', r'totally', r'absolutely'
+)
+_CLICKBAIT_RE = _union_regex(_CLICKBAIT_PATTERNS)
+_ABSOLUTE_RE = _union_regex(_ABSOLUTE_PATTERNS)
+
+# Literal bias phrases (Config.BIAS_INDICATORS plus emotional words) as (lowercased phrase,
+# indicator) pairs, all found by a single scan. A phrase may carry several indicators,
+# e.g. 'shocking' is both a bias indicator and emotional language.
+_BIAS_PHRASES = tuple(
+    [(indicator.lower(), indicator) for indicator in Config.BIAS_INDICATORS]
+    + [(word, f'Emotional language: {word}') for word in _EMOTIONAL_WORDS]
+)
+_BIAS_PHRASE_INDEXES = {
+    phrase: [i for i, (other, _) in enumerate(_BIAS_PHRASES) if other == phrase]
+    for phrase, _ in _BIAS_PHRASES
+}
+# Longest phrase first; the lookahead reports overlapping hits, like plain substring checks
+_BIAS_PHRASE_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_BIAS_PHRASE_INDEXES, key=len, reverse=True))) + '))'
+)
+
+# Domain keywords that suggest a sensationalist or imitation outlet
+_SUSPICIOUS_DOMAIN_KEYWORDS = ('fake', 'real', 'truth', 'insider', 'leaked', 'exposed')
+_SUSPICIOUS_DOMAIN_RE = _union_regex(_SUSPICIOUS_DOMAIN_KEYWORDS)
+
+@functools.lru_cache(maxsize=4096)
+def _suspicious_domain_keywords(domain: str) -> Tuple[str, ...]:
+    """Suspicious keywords contained in a domain; the same outlets recur across many articles"""
+    hits = _matched_indexes(_SUSPICIOUS_DOMAIN_RE, domain.lower())
+    return tuple(_SUSPICIOUS_DOMAIN_KEYWORDS[i] for i in hits)
+
+def _analysis_window(text: str) -> str:
+    """Text bounded to Config.MAX_ANALYZE_CHARS: long texts keep their first and last halves"""
+    limit = Config.MAX_ANALYZE_CHARS
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return f"{text[:half]} {text[-half:]}"
+
+def _has_words(text: str, count: int) -> bool:
+    """True if text has at least count words; splits no further than needed"""
+    return bool(text) and len(text.split(None, count - 1)) >= count
+
+def _count_sentences(text: str) -> int:
+    """Approximate sentence count from terminator characters (str.count, no match list).
+    
+    Each '...' counts once; other runs such as '?!' count per character, a small over-count
+    that only affects the average sentence length.
+    """
+    return text.count('.') + text.count('!') + text.count('?') - 2 * text.count('...')
+
+# Byte values of A-Z, deleted by bytes.translate to count capitals in ASCII text
+_ASCII_UPPERCASE = bytes(range(ord('A'), ord('Z') + 1))
+
+def _count_uppercase(text: str) -> int:
+    """Number of uppercase characters, counted in C rather than with a per-character genexpr"""
+    if text.isascii():
+        # For ASCII text, str.isupper() is exactly A-Z
+        data = text.encode('ascii')
+        return len(data) - len(data.translate(None, _ASCII_UPPERCASE))
+    return sum(map(str.isupper, text))
+
 @dataclass
 class NewsAnalysisResult:
     """Data class to store news analysis results"""
+    # Explicit slots drop the per-instance __dict__ (dataclass(slots=True) needs Python 3.10);
+    # this works because no field has a default value
+    __slots__ = (
+        'overall_credibility_score', 'credibility_level', 'sentiment_analysis',
+        'source_credibility', 'content_analysis', 'cross_reference_results',
+        'fact_check_results', 'ai_analysis', 'bias_indicators', 'warning_flags',
+        'recommendations', 'confidence_score', 'analysis_timestamp'
+    )
+    
     overall_credibility_score: float
     credibility_level: str
     sentiment_analysis: Dict[str, Any]
@@ -29,10 +141,25 @@ class NewsAnalysisResult:
     recommendations: List[str]
     confidence_score: float
     analysis_timestamp: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of all result fields, for JSON responses and socket events"""
+        return {name: getattr(self, name) for name in _RESULT_FIELDS}
+
+# Field names resolved once rather than per conversion
+_RESULT_FIELDS = tuple(field.name for field in fields(NewsAnalysisResult))
 
 class NewsAnalyzer:
     """Main class for analyzing news articles for credibility and bias"""
     
+    # Ascending credibility thresholds and the level for scores below, between and above them
+    _LEVEL_THRESHOLDS = (
+        Config.LOW_CREDIBILITY_THRESHOLD,
+        Config.MEDIUM_CREDIBILITY_THRESHOLD,
+        Config.HIGH_CREDIBILITY_THRESHOLD
+    )
+    _LEVEL_LABELS = ("Very Low", "Low", "Medium", "High")
+    
     def __init__(self):
         self.news_api = NewsAPIClient()
         self.fact_check_api = GoogleFactCheckClient()
@@ -56,6 +183,39 @@ class NewsAnalyzer:
         if not title and not content:
             raise ValueError("Either title or content must be provided")
         
+        key = hashlib.blake2b(
+            f"{url or ''}|{title or ''}|{content or ''}".encode('utf-8'), digest_size=16
+        ).digest()
+        with _result_lock:
+            cached = _result_cache.get(key)
+        if cached is not None:
+            # Same verdict, stamped with the time of this request; a deep copy so callers
+            # can't modify the cached entry through the result's dicts and lists
+            return replace(copy.deepcopy(cached), analysis_timestamp=datetime.now().isoformat())
+        
+        result = self._analyze_uncached(url, title, content)
+        
+        # Analyses with a failed lookup are retried next time rather than cached
+        if self._lookups_succeeded(result):
+            snapshot = copy.deepcopy(result)  # Detached from the result handed to this caller
+            with _result_lock:
+                _result_cache[key] = snapshot
+        return result
+    
+    def _lookups_succeeded(self, result: NewsAnalysisResult) -> bool:
+        """True unless a configured remote lookup (cross-reference, fact check, Gemini) failed"""
+        cross_ref = result.cross_reference_results
+        if 'error' in cross_ref or cross_ref.get('lookup_errors'):
+            return False
+        
+        fact_check = result.fact_check_results
+        if self.fact_check_api.api_key and (fact_check.get('status') == 'error' or 'error' in fact_check):
+            return False
+        
+        return result.ai_analysis.get('status') != 'error'
+    
+    def _analyze_uncached(self, url: str, title: str, content: str) -> NewsAnalysisResult:
+        """Run the full analysis pipeline for one article"""
         # Initialize analysis components
         sentiment_analysis = {}
         source_credibility = {}
@@ -66,47 +226,47 @@ class NewsAnalyzer:
         warning_flags = []
         recommendations = []
         
+        # Remote lookups are independent of each other and of the local analysis, so start them
+        # all up front and only wait where their results are needed
+        fut_cross_ref = fut_fact_check = None
+        if title:
+            fut_cross_ref = _REMOTE_EXECUTOR.submit(
+                self.cross_reference.cross_reference_story, title, content or ""
+            )
+            fut_fact_check = _REMOTE_EXECUTOR.submit(self.fact_check_api.search_fact_checks, title)
+        
+        # AI-powered analysis using Gemini (optional enhancement), if there is enough text for it
+        fut_ai = None
+        if (_has_words(content, Config.MIN_CONTENT_WORDS)
+                or _has_words(title, Config.MIN_TITLE_WORDS)):
+            fut_ai = _REMOTE_EXECUTOR.submit(self._analyze_with_ai, title, content)
+        
+        # Title plus the bounded content window, built and lowercased once and shared by the
+        # content and bias pattern scans
+        window = _analysis_window(content) if content else ''
+        text_to_analyze = f"{title} {window}" if title and window else (title or window)
+        lower_text = text_to_analyze.lower()
+        
         # Analyze sentiment and content
         if content:
             sentiment_analysis = self.text_analyzer.analyze_sentiment_textblob(content)
-            content_analysis = self._analyze_content(content, title or "")
+            content_analysis = self._analyze_content(content, title or "", lower_text, window)
         
         # Analyze source credibility
         if url:
             source_credibility = self._analyze_source(url)
         
-        # Cross-reference the story
-        if title:
-            cross_reference_results = self.cross_reference.cross_reference_story(
-                title, content or ""
-            )
-        
-        # Search for fact checks
-        if title:
-            fact_check_results = self.fact_check_api.search_fact_checks(title)
-        
-        # AI-powered analysis using Gemini (optional enhancement)
-        ai_analysis = {}
-        if title or content:
-            try:
-                ai_analysis = self.gemini_ai.analyze_news_credibility(title or "", content or "")
-                
-                # If AI analysis successful, also get bias analysis
-                if ai_analysis.get('status') == 'success':
-                    text_for_bias = f"{title or ''} {content or ''}"[:2000]
-                    bias_analysis = self.gemini_ai.detect_bias_and_manipulation(text_for_bias)
-                    if bias_analysis.get('status') == 'success':
-                        ai_analysis['bias_analysis'] = bias_analysis
-                else:
-                    # AI analysis failed, continue without it
-                    ai_analysis = {'status': 'unavailable', 'message': 'AI analysis not available'}
-                        
-            except Exception as e:
-                ai_analysis = {'status': 'error', 'message': f'AI analysis failed: {str(e)}'}
-        
         # Identify bias indicators
-        text_to_analyze = f"{title or ''} {content or ''}".strip()
-        bias_indicators = self._identify_bias_indicators(text_to_analyze)
+        bias_indicators = self._identify_bias_indicators(text_to_analyze, lower_text)
+        
+        # Collect the cross-reference, fact check and AI results
+        if fut_cross_ref is not None:
+            cross_reference_results = fut_cross_ref.result()
+            fact_check_results = fut_fact_check.result()
+        if fut_ai is not None:
+            ai_analysis = fut_ai.result()
+        else:
+            ai_analysis = {'status': 'skipped', 'message': 'Too little text for AI analysis'}
         
         # Generate warning flags
         warning_flags = self._generate_warning_flags(
@@ -144,10 +304,121 @@ class NewsAnalyzer:
             analysis_timestamp=datetime.now().isoformat()
         )
     
+    def _analyze_with_ai(self, title: str, content: str) -> Dict[str, Any]:
+        """Gemini credibility and bias analysis, fetched in one request"""
+        try:
+            ai_analysis = self.gemini_ai.analyze_combined(title or "", content or "")
+            
+            if ai_analysis.get('status') != 'success':
+                if self.gemini_ai.api_key:
+                    # Configured but failed: keep the error so the result is not cached
+                    return {'status': 'error', 'message': ai_analysis.get('message', 'AI analysis failed')}
+                # AI analysis not configured, continue without it
+                ai_analysis = {'status': 'unavailable', 'message': 'AI analysis not available'}
+            
+            return ai_analysis
+        
+        except Exception as e:
+            return {'status': 'error', 'message': f'AI analysis failed: {str(e)}'}
+    
+    def analyze_batch(self, titles: List[str], contents: List[str] = None,
+                      max_workers: int = 8) -> List[Union[NewsAnalysisResult, Exception]]:
+        """
+        Analyze many articles in one call, returning results in input order
+        
+        Args:
+            titles: Titles/headlines of the articles
+            contents: Optional article texts, aligned with titles
+            max_workers: Number of articles analyzed concurrently
+        
+        Returns:
+            List with one NewsAnalysisResult per title, or the exception its analysis raised
+        """
+        if contents is None:
+            contents = [None] * len(titles)
+        elif len(contents) != len(titles):
+            raise ValueError("titles and contents must have the same length")
+        
+        return self.analyze_articles(
+            [{'title': title, 'content': content} for title, content in zip(titles, contents)],
+            max_concurrency=max_workers
+        )
+    
+    def analyze_articles(self, items: List[Dict[str, str]],
+                         max_concurrency: int = 16) -> List[Union[NewsAnalysisResult, Exception]]:
+        """
+        Analyze a batch of articles concurrently, returning results in input order
+        
+        Args:
+            items: Dicts with any of 'url', 'title' and 'content' (as for analyze_article)
+            max_concurrency: Number of articles analyzed at once
+        
+        Returns:
+            List with one NewsAnalysisResult per item, or the exception its analysis raised
+        """
+        # Identical articles in one batch (e.g. the same story from several feeds) are analyzed once
+        keys = [(item.get('url'), item.get('title'), item.get('content')) for item in items]
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return []
+        
+        # Each analysis is dominated by API round-trips, so overlap them. A dedicated pool is
+        # used because every analysis already waits on the module's remote-lookup pool.
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(unique))) as executor:
+            futures = {key: executor.submit(self.analyze_article, *key) for key in unique}
+        
+        # A failing article is reported in its own slot instead of aborting the whole batch
+        results = {key: future.exception() or future.result() for key, future in futures.items()}
+        # The first slot for an article gets its result; repeats get their own copy to mutate
+        seen = set()
+        ordered = []
+        for key in keys:
+            result = results[key]
+            if key in seen and not isinstance(result, Exception):
+                result = copy.deepcopy(result)
+            seen.add(key)
+            ordered.append(result)
+        return ordered
+    
+    def assess_reliable_source(self, url: str, title: str = None) -> NewsAnalysisResult:
+        """
+        Lightweight analysis for articles from known reliable sources
+        
+        Only the source is scored; sentiment, cross-reference, fact-check and AI
+        analysis are skipped, so the result carries a reduced confidence.
+        
+        Args:
+            url: URL of the article
+            title: Title/headline of the article (optional)
+        
+        Returns:
+            NewsAnalysisResult object based on source credibility alone
+        """
+        source_credibility = self._analyze_source(url)
+        credibility_score = source_credibility['credibility_score']
+        bias_indicators = self._identify_bias_indicators(title) if title else []
+        warning_flags = self._generate_warning_flags({}, source_credibility, {}, bias_indicators, {})
+        
+        return NewsAnalysisResult(
+            overall_credibility_score=credibility_score,
+            credibility_level=self._determine_credibility_level(credibility_score),
+            sentiment_analysis={},
+            source_credibility=source_credibility,
+            content_analysis={},
+            cross_reference_results={},
+            fact_check_results={},
+            ai_analysis={'status': 'skipped', 'message': 'Known reliable source - full analysis skipped'},
+            bias_indicators=bias_indicators,
+            warning_flags=warning_flags,
+            recommendations=self._generate_recommendations(credibility_score, warning_flags, source_credibility),
+            confidence_score=0.2,  # One of five factors analyzed
+            analysis_timestamp=datetime.now().isoformat()
+        )
+    
     def _analyze_source(self, url: str) -> Dict[str, Any]:
         """Analyze the credibility of the news source"""
         try:
-            parsed_url = urlparse(url)
+            parsed_url = parse_url(url)
             domain = parsed_url.netloc.lower()
             
             # Remove www. prefix
@@ -184,40 +455,38 @@ class NewsAnalyzer:
         except Exception as e:
             return {'error': f'Source analysis failed: {str(e)}', 'credibility_score': 0.3}
     
-    def _analyze_content(self, content: str, title: str) -> Dict[str, Any]:
+    def _analyze_content(self, content: str, title: str, lower_text: str = None,
+                         sample: str = None) -> Dict[str, Any]:
         """Analyze the content of the article for credibility indicators"""
+        # Callers may pass the analysis window of content (sample) and the lowercased title plus
+        # window (lower_text). Counts cover the whole article; keyword, pattern and ratio checks
+        # use the bounded sample.
+        if sample is None:
+            sample = _analysis_window(content)
+        length = len(sample)
         analysis = {
             'length': len(content),
             'word_count': len(content.split()),
-            'sentence_count': len(re.findall(r'[.!?]+', content)),
-            'keywords': self.text_analyzer.extract_keywords(content),
+            'sentence_count': _count_sentences(content),
+            'keywords': self.text_analyzer.extract_keywords(sample),
             'readability_indicators': {},
             'suspicious_patterns': []
         }
         
         # Check for suspicious patterns
-        full_text = f"{title} {content}".lower()
-        
-        # Check for clickbait indicators
-        clickbait_patterns = [
-            r'you won\'t believe',
-            r'shocking',
-            r'this will blow your mind',
-            r'doctors hate this',
-            r'number \d+ will shock you'
-        ]
+        full_text = lower_text if lower_text is not None else f"{title} {sample}".lower()
         
-        for pattern in clickbait_patterns:
-            if re.search(pattern, full_text):
-                analysis['suspicious_patterns'].append(f'Clickbait pattern: {pattern}')
+        # Check for clickbait indicators (one scan for all patterns)
+        for i in _matched_indexes(_CLICKBAIT_RE, full_text):
+            analysis['suspicious_patterns'].append(f'Clickbait pattern: {_CLICKBAIT_PATTERNS[i]}')
         
         # Check for excessive capitalization
-        caps_ratio = sum(1 for c in content if c.isupper()) / max(len(content), 1)
+        caps_ratio = _count_uppercase(sample) / max(length, 1)
         if caps_ratio > 0.1:  # More than 10% caps
             analysis['suspicious_patterns'].append('Excessive capitalization')
         
         # Check for excessive punctuation
-        punct_ratio = sum(1 for c in content if c in '!?') / max(len(content), 1)
+        punct_ratio = (sample.count('!') + sample.count('?')) / max(length, 1)
         if punct_ratio > 0.02:  # More than 2% exclamation/question marks
             analysis['suspicious_patterns'].append('Excessive punctuation')
         
@@ -232,50 +501,39 @@ class NewsAnalyzer:
         
         return analysis
     
-    def _identify_bias_indicators(self, text: str) -> List[str]:
-        """Identify potential bias indicators in the text"""
+    def _identify_bias_indicators(self, text: str, text_lower: str = None) -> List[str]:
+        """Identify potential bias indicators in the text (text_lower: text.lower(), if known)"""
         indicators = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Check for bias indicator phrases from config
-        for indicator in Config.BIAS_INDICATORS:
-            if indicator.lower() in text_lower:
-                indicators.append(indicator)
-        
-        # Check for emotional language
-        emotional_words = [
-            'outrageous', 'disgraceful', 'shocking', 'unbelievable',
-            'devastating', 'alarming', 'terrifying', 'incredible'
-        ]
-        
-        for word in emotional_words:
-            if word in text_lower:
-                indicators.append(f'Emotional language: {word}')
+        # Check for bias indicator phrases from config and emotional language (one scan for both)
+        hits = set()
+        for phrase in set(_BIAS_PHRASE_RE.findall(text_lower)):
+            hits.update(_BIAS_PHRASE_INDEXES[phrase])
+        indicators.extend(_BIAS_PHRASES[i][1] for i in sorted(hits))
         
         # Check for absolute statements
-        absolute_patterns = [
-            r'always', r'never', r'all .* are', r'every .* is',
-            r'completely', r'totally', r'absolutely'
-        ]
-        
-        for pattern in absolute_patterns:
-            if re.search(pattern, text_lower):
-                indicators.append(f'Absolute statement: {pattern}')
+        for i in _matched_indexes(_ABSOLUTE_RE, text_lower):
+            indicators.append(f'Absolute statement: {_ABSOLUTE_PATTERNS[i]}')
         
-        return list(set(indicators))  # Remove duplicates
+        return list(dict.fromkeys(indicators))  # Remove duplicates, keeping first-seen order
     
     def _calculate_credibility_score(self, sentiment_analysis: Dict, source_credibility: Dict,
                                    content_analysis: Dict, cross_reference_results: Dict,
                                    bias_indicators: List, fact_check_results: Dict, ai_analysis: Dict) -> Tuple[float, float]:
         """Calculate overall credibility score and confidence level"""
         
-        scores = []
-        weights = []
+        # Running weighted sum instead of parallel score/weight lists (at most six factors)
+        weighted_sum = 0.0
+        total_weight = 0.0
+        factors = 0
         
         # Source credibility (25% weight)
         if source_credibility.get('credibility_score') is not None:
-            scores.append(source_credibility['credibility_score'])
-            weights.append(0.25)
+            weighted_sum += source_credibility['credibility_score'] * 0.25
+            total_weight += 0.25
+            factors += 1
         
         # Content quality (20% weight)
         content_score = 0.5  # Default neutral
@@ -289,44 +547,47 @@ class NewsAnalyzer:
             if 200 <= word_count <= 2000:
                 content_score += 0.1
         
-        scores.append(content_score)
-        weights.append(0.2)
+        weighted_sum += content_score * 0.2
+        total_weight += 0.2
+        factors += 1
         
         # Cross-reference consensus (15% weight)
         if cross_reference_results.get('consensus_score') is not None:
             consensus_score = cross_reference_results['consensus_score']
             # Higher consensus = higher credibility
-            scores.append(min(0.5 + consensus_score * 0.5, 1.0))
-            weights.append(0.15)
+            weighted_sum += min(0.5 + consensus_score * 0.5, 1.0) * 0.15
+            total_weight += 0.15
+            factors += 1
         
         # Bias indicators (10% weight)
         bias_score = max(0.8 - len(bias_indicators) * 0.1, 0.2)
-        scores.append(bias_score)
-        weights.append(0.1)
+        weighted_sum += bias_score * 0.1
+        total_weight += 0.1
+        factors += 1
         
         # AI Analysis (20% weight) - highest priority for advanced reasoning
         if ai_analysis.get('status') == 'success' and ai_analysis.get('credibility_score') is not None:
             ai_score = ai_analysis['credibility_score']
             # AI provides sophisticated analysis, so give it significant weight
-            scores.append(ai_score)
-            weights.append(0.2)
+            weighted_sum += ai_score * 0.2
+            total_weight += 0.2
+            factors += 1
         
         # Sentiment objectivity (10% weight)
         if sentiment_analysis.get('subjectivity') is not None:
             objectivity = 1 - sentiment_analysis['subjectivity']
             # More objective = higher credibility
             subjectivity_score = 0.3 + (objectivity * 0.7)
-            scores.append(subjectivity_score)
-            weights.append(0.1)
+            weighted_sum += subjectivity_score * 0.1
+            total_weight += 0.1
+            factors += 1
         
         # Calculate weighted average
-        if scores and weights:
-            total_weight = sum(weights)
-            weighted_sum = sum(score * weight for score, weight in zip(scores, weights))
+        if factors:
             final_score = weighted_sum / total_weight
             
             # Calculate confidence based on number of factors analyzed
-            confidence = len(scores) / 5.0  # Max 5 factors
+            confidence = factors / 5.0  # Max 5 factors
         else:
             final_score = 0.3  # Low default if no analysis possible
             confidence = 0.2
@@ -335,14 +596,8 @@ class NewsAnalyzer:
     
     def _determine_credibility_level(self, score: float) -> str:
         """Determine credibility level based on score"""
-        if score >= Config.HIGH_CREDIBILITY_THRESHOLD:
-            return "High"
-        elif score >= Config.MEDIUM_CREDIBILITY_THRESHOLD:
-            return "Medium"
-        elif score >= Config.LOW_CREDIBILITY_THRESHOLD:
-            return "Low"
-        else:
-            return "Very Low"
+        # bisect_right puts a score equal to a threshold in the level above it, as ">=" did
+        return self._LEVEL_LABELS[bisect.bisect_right(self._LEVEL_THRESHOLDS, score)]
     
     def _generate_warning_flags(self, sentiment_analysis: Dict, source_credibility: Dict,
                               content_analysis: Dict, bias_indicators: List,
@@ -411,13 +666,8 @@ class NewsAnalyzer:
         indicators = {
             'has_common_tld': domain.endswith(('.com', '.org', '.gov', '.edu', '.net')),
             'length': len(domain),
-            'suspicious_keywords': []
+            # Check for suspicious keywords in domain
+            'suspicious_keywords': list(_suspicious_domain_keywords(domain))
         }
         
-        # Check for suspicious keywords in domain
-        suspicious = ['fake', 'real', 'truth', 'insider', 'leaked', 'exposed']
-        for keyword in suspicious:
-            if keyword in domain.lower():
-                indicators['suspicious_keywords'].append(keyword)
-        
         return indicators